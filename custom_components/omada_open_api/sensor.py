@@ -1350,10 +1350,17 @@ class OmadaPoeSensor(OmadaEntity[OmadaSiteCoordinator], SensorEntity):
             identifiers={(DOMAIN, switch_mac)},
         )
 
+    def _get_port_data(self) -> dict[str, Any] | None:
+        """Return the PoE port data dict, or None if the port is gone."""
+        port_data: dict[str, Any] | None = self.coordinator.data.get(
+            "poe_ports", {}
+        ).get(self._port_key)
+        return port_data
+
     @property
     def native_value(self) -> float | None:
         """Return PoE power consumption in watts."""
-        port_data = self.coordinator.data.get("poe_ports", {}).get(self._port_key)
+        port_data = self._get_port_data()
         if port_data is None:
             return None
         power: float = port_data.get("power", 0.0)
@@ -1362,7 +1369,7 @@ class OmadaPoeSensor(OmadaEntity[OmadaSiteCoordinator], SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        port_data = self.coordinator.data.get("poe_ports", {}).get(self._port_key)
+        port_data = self._get_port_data()
         if port_data is None:
             return {}
 
@@ -1390,7 +1397,7 @@ class OmadaPoeSensor(OmadaEntity[OmadaSiteCoordinator], SensorEntity):
         if not self.coordinator.last_update_success:
             return False
 
-        port_data = self.coordinator.data.get("poe_ports", {}).get(self._port_key)
+        port_data = self._get_port_data()
         return port_data is not None
 
 
@@ -185,6 +185,8 @@ class OmadaPoeSwitch(
 
         self._switch_mac = switch_mac
         self._port_num = port_num
+        # PoE state set by this entity, shown until the next coordinator update.
+        self._optimistic_poe: bool | None = None
 
         self._attr_unique_id = f"{switch_mac}_port{port_num}_poe"
         self._attr_translation_key = "poe"
@@ -205,6 +207,8 @@ class OmadaPoeSwitch(
         port_data = self.coordinator.data.get("poe_ports", {}).get(self._port_key)
         if port_data is None:
             return None
+        if self._optimistic_poe is not None:
+            return self._optimistic_poe
         return bool(port_data.get("poe_enabled", False))
 
     @property
@@ -230,6 +234,12 @@ class OmadaPoeSwitch(
             self.coordinator.data.get("poe_ports", {}).get(self._port_key) is not None
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._optimistic_poe = None
+        super()._handle_coordinator_update()
+
     # ------------------------------------------------------------------
     # Control
     # ------------------------------------------------------------------
@@ -273,6 +283,10 @@ class OmadaPoeSwitch(
                 f"for {self._switch_mac} port {self._port_num}"
             ) from err
 
+        # Show the new state right away; the refresh below confirms it.
+        self._optimistic_poe = enabled
+        self.async_write_ha_state()
+
         # Refresh coordinator data to reflect the change.
         await self.coordinator.async_request_refresh()
 
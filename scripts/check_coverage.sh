@@ -6,7 +6,7 @@ set -euo pipefail
 THRESHOLD_FILE=".coverage-threshold"
 
 # Run pytest with coverage and capture the total percentage.
-output=$(pytest tests/ -x -q \
+output=$(pytest tests/ -n auto --dist loadgroup -x -q \
     --cov=custom_components.omada_open_api \
     --cov-report=term-missing 2>&1) || {
     echo "$output"
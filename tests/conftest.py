@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import TYPE_CHECKING
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
+from blockbuster import blockbuster_ctx
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
 from custom_components.omada_open_api.const import (
     CONF_ACCESS_TOKEN,
@@ -23,6 +25,13 @@ from custom_components.omada_open_api.const import (
     CONF_SELECTED_SITES,
     CONF_TOKEN_EXPIRES_AT,
 )
+from custom_components.omada_open_api.devices import process_device
+from custom_components.omada_open_api.sensor import (
+    AP_BAND_CLIENT_SENSORS,
+    DEVICE_SENSORS,
+    OmadaDeviceSensor,
+    OmadaSensorEntityDescription,
+)
 
 pytest_plugins = "pytest_homeassistant_custom_component"
 
@@ -175,6 +184,85 @@ SAMPLE_CLIENT_WIRED = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Sensor entity helpers
+# ---------------------------------------------------------------------------
+
+DEVICE_SENSOR_BY_KEY = MappingProxyType({d.key: d for d in DEVICE_SENSORS})
+AP_BAND_SENSOR_BY_KEY = MappingProxyType({d.key: d for d in AP_BAND_CLIENT_SENSORS})
+
+# Sensors only read api_url from the client, to build device info.
+_STUB_API_CLIENT = SimpleNamespace(api_url=TEST_API_URL)
+
+
+def create_stub_coordinator(
+    data: dict,
+    api_client: object = _STUB_API_CLIENT,
+    *,
+    async_request_refresh: AsyncMock | None = None,
+) -> SimpleNamespace:
+    """Return a stand-in coordinator holding ``data``.
+
+    Entities only read data, last_update_success, api_client and the site
+    identifiers from their coordinator, so tests can skip the
+    DataUpdateCoordinator setup, and the hass instance, that a real
+    coordinator needs. Entities that write through the API also need an
+    ``api_client`` specced on OmadaApiClient and an ``async_request_refresh``
+    mock to await afterwards.
+    """
+    coordinator = SimpleNamespace(
+        data=data,
+        last_update_success=True,
+        api_client=api_client,
+        site_id=TEST_SITE_ID,
+        site_name=TEST_SITE_NAME,
+    )
+    if async_request_refresh is not None:
+        coordinator.async_request_refresh = async_request_refresh
+    return coordinator
+
+
+def create_stub_sensor(
+    sensor_cls: Callable[..., Any],
+    description: object,
+    data: dict,
+    **kwargs: Any,
+) -> Any:
+    """Create a coordinator entity backed by a stub coordinator holding ``data``.
+
+    Extra keyword arguments (device_mac, gateway_mac, ...) are passed on to
+    ``sensor_cls``.
+    """
+    return sensor_cls(
+        coordinator=create_stub_coordinator(data),
+        description=description,
+        **kwargs,
+    )
+
+
+def create_device_sensor(
+    device_mac: str,
+    device_data: dict,
+    description: OmadaSensorEntityDescription,
+) -> OmadaDeviceSensor:
+    """Create an OmadaDeviceSensor backed by a stub site coordinator.
+
+    ``device_data`` is registered under ``device_mac``.
+    """
+    return create_stub_sensor(
+        OmadaDeviceSensor,
+        description,
+        {
+            "devices": {device_mac: device_data},
+            "poe_ports": {},
+            "poe_budget": {},
+            "site_id": TEST_SITE_ID,
+            "site_name": TEST_SITE_NAME,
+        },
+        device_mac=device_mac,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -188,6 +276,17 @@ def auto_enable_custom_integrations(
     return
 
 
+@pytest.fixture(autouse=True)
+def blockbuster() -> Generator:
+    """Fail any test where the integration makes a blocking call in the loop.
+
+    Detection is limited to frames originating from the integration so
+    Home Assistant's own test harness I/O does not trip it.
+    """
+    with blockbuster_ctx(scanned_modules=["custom_components.omada_open_api"]) as bb:
+        yield bb
+
+
 @pytest.fixture
 def mock_config_entry_data() -> dict:
     """Return standard config entry data."""
@@ -256,6 +355,27 @@ def mock_api_client() -> MagicMock:
     return client
 
 
+@pytest.fixture(scope="session")
+def processed_ap() -> dict:
+    """Return SAMPLE_DEVICE_AP run through process_device.
+
+    Session-scoped and shared: copy before mutating.
+    """
+    return process_device(SAMPLE_DEVICE_AP)
+
+
+@pytest.fixture(scope="session")
+def processed_switch() -> dict:
+    """Return SAMPLE_DEVICE_SWITCH run through process_device."""
+    return process_device(SAMPLE_DEVICE_SWITCH)
+
+
+@pytest.fixture(scope="session")
+def processed_gateway() -> dict:
+    """Return SAMPLE_DEVICE_GATEWAY run through process_device."""
+    return process_device(SAMPLE_DEVICE_GATEWAY)
+
+
 # ---------------------------------------------------------------------------
 # PoE sample data
 # ---------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
@@ -26,6 +27,13 @@ from .conftest import (
 WIRELESS_MAC = "11-22-33-44-55-AA"
 WIRED_MAC = "11-22-33-44-55-BB"
 
+# Only consulted when the coordinator refreshes, which these tests never do.
+_SELECTED_MACS = [WIRELESS_MAC, WIRED_MAC]
+
+_CLIENT_BINARY_SENSOR_BY_KEY = MappingProxyType(
+    {d.key: d for d in CLIENT_BINARY_SENSORS}
+)
+
 
 def _processed_wireless() -> dict:
     """Return processed wireless client data."""
@@ -49,15 +57,13 @@ def _create_client_binary_sensor(
         api_client=MagicMock(),
         site_id=TEST_SITE_ID,
         site_name=TEST_SITE_NAME,
-        selected_client_macs=list(clients.keys()),
+        selected_client_macs=_SELECTED_MACS,
     )
     coordinator.data = clients
 
-    description = next(d for d in CLIENT_BINARY_SENSORS if d.key == description_key)
-
     return OmadaClientBinarySensor(
         coordinator=coordinator,
-        description=description,
+        description=_CLIENT_BINARY_SENSOR_BY_KEY[description_key],
         client_mac=client_mac,
     )
 
@@ -10,6 +10,8 @@ from custom_components.omada_open_api.devices import (
     process_device,
 )
 
+from .conftest import SAMPLE_DEVICE_AP
+
 # ---------------------------------------------------------------------------
 # parse_uptime
 # ---------------------------------------------------------------------------
@@ -126,3 +128,14 @@ def test_process_device_minimal() -> None:
     assert result["type"] == "unknown"
     assert result["client_num"] == 0
     assert result["need_upgrade"] is False
+
+
+def test_process_device_detail_status_passthrough(processed_ap: dict) -> None:
+    """Test detailStatus is copied through untouched.
+
+    The device sensor tests override detail_status on the processed AP
+    instead of re-running process_device, which relies on this.
+    """
+    for code in (14, None):
+        raw = {**SAMPLE_DEVICE_AP, "detailStatus": code}
+        assert process_device(raw) == {**processed_ap, "detail_status": code}
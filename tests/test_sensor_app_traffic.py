@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import UnitOfInformation
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 from custom_components.omada_open_api.const import DOMAIN
 from custom_components.omada_open_api.sensor import (
@@ -73,25 +78,40 @@ def test_auto_scale_bytes_terabytes() -> None:
 # ---------------------------------------------------------------------------
 
 
-def _make_coordinator(data: dict | None = None) -> MagicMock:
-    """Create a minimal mock coordinator for app traffic sensor."""
-    coordinator = MagicMock()
-    coordinator.data = data or {}
-    coordinator.last_update_success = True
-    coordinator.site_id = TEST_SITE_ID
-    return coordinator
+_CLIENT_MAC = "11-22-33-44-55-AA"
+
+
+@pytest.fixture(scope="module")
+def _coordinator() -> SimpleNamespace:
+    """Return a minimal stand-in coordinator shared by the module."""
+    return SimpleNamespace(data={}, last_update_success=True, site_id=TEST_SITE_ID)
+
+
+@pytest.fixture
+def make_sensor(
+    _coordinator: SimpleNamespace,
+) -> Callable[..., OmadaClientAppTrafficSensor]:
+    """Return a factory building app traffic sensors on the shared coordinator."""
 
+    def _make(
+        metric_type: str = "download", data: dict | None = None
+    ) -> OmadaClientAppTrafficSensor:
+        _coordinator.data = data or {}
+        _coordinator.last_update_success = True
+        return OmadaClientAppTrafficSensor(
+            coordinator=_coordinator,
+            client_mac=_CLIENT_MAC,
+            app_id="100",
+            app_name="YouTube",
+            metric_type=metric_type,
+        )
 
-def test_app_traffic_sensor_init() -> None:
+    return _make
+
+
+def test_app_traffic_sensor_init(make_sensor: Callable[..., Any]) -> None:
     """Test app traffic sensor initialization sets correct attributes."""
-    coordinator = _make_coordinator()
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
+    sensor = make_sensor()
 
     assert sensor._attr_unique_id == "11-22-33-44-55-AA_100_download_app_traffic"  # noqa: SLF001
     assert sensor._attr_translation_key == "app_download"  # noqa: SLF001
@@ -100,27 +120,20 @@ def test_app_traffic_sensor_init() -> None:
     assert sensor._attr_device_info["identifiers"] == {(DOMAIN, "11-22-33-44-55-AA")}  # noqa: SLF001
 
 
-def test_app_traffic_sensor_upload_icon() -> None:
+def test_app_traffic_sensor_upload_icon(make_sensor: Callable[..., Any]) -> None:
     """Test that upload metric type sets upload icon."""
-    coordinator = _make_coordinator()
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="upload",
-    )
+    sensor = make_sensor(metric_type="upload")
 
     assert sensor._attr_icon == "mdi:upload-network"  # noqa: SLF001
     assert sensor._attr_translation_key == "app_upload"  # noqa: SLF001
     assert sensor._attr_translation_placeholders == {"app_name": "YouTube"}  # noqa: SLF001
 
 
-def test_app_traffic_sensor_native_value() -> None:
+def test_app_traffic_sensor_native_value(make_sensor: Callable[..., Any]) -> None:
     """Test native_value returns auto-scaled value."""
-    coordinator = _make_coordinator(
-        {
-            "11-22-33-44-55-AA": {
+    sensor = make_sensor(
+        data={
+            _CLIENT_MAC: {
                 "100": {
                     "download": 5_000_000,
                     "upload": 1_000,
@@ -129,38 +142,28 @@ def test_app_traffic_sensor_native_value() -> None:
             }
         }
     )
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
 
     assert sensor.native_value == 5.0
     assert sensor._attr_native_unit_of_measurement == UnitOfInformation.MEGABYTES  # noqa: SLF001
 
 
-def test_app_traffic_sensor_native_value_no_data() -> None:
+def test_app_traffic_sensor_native_value_no_data(
+    make_sensor: Callable[..., Any],
+) -> None:
     """Test native_value when no data exists returns 0 scaled."""
-    coordinator = _make_coordinator({})
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
+    sensor = make_sensor(data={})
 
     # No client data → raw_bytes defaults to 0
     assert sensor.native_value == 0.0
 
 
-def test_app_traffic_sensor_extra_state_attributes() -> None:
+def test_app_traffic_sensor_extra_state_attributes(
+    make_sensor: Callable[..., Any],
+) -> None:
     """Test extra_state_attributes returns expected fields."""
-    coordinator = _make_coordinator(
-        {
-            "11-22-33-44-55-AA": {
+    sensor = make_sensor(
+        data={
+            _CLIENT_MAC: {
                 "100": {
                     "download": 5_000_000,
                     "upload": 1_000_000,
@@ -172,13 +175,6 @@ def test_app_traffic_sensor_extra_state_attributes() -> None:
             }
         }
     )
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
 
     attrs = sensor.extra_state_attributes
     assert attrs["application_id"] == "100"
@@ -190,11 +186,13 @@ def test_app_traffic_sensor_extra_state_attributes() -> None:
     assert "total_traffic" in attrs
 
 
-def test_app_traffic_sensor_extra_state_attributes_minimal() -> None:
+def test_app_traffic_sensor_extra_state_attributes_minimal(
+    make_sensor: Callable[..., Any],
+) -> None:
     """Test extra_state_attributes with minimal data."""
-    coordinator = _make_coordinator(
-        {
-            "11-22-33-44-55-AA": {
+    sensor = make_sensor(
+        data={
+            _CLIENT_MAC: {
                 "100": {
                     "download": 100,
                     "app_name": "YouTube",
@@ -202,13 +200,6 @@ def test_app_traffic_sensor_extra_state_attributes_minimal() -> None:
             }
         }
     )
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
 
     attrs = sensor.extra_state_attributes
     assert "application_description" not in attrs
@@ -216,48 +207,27 @@ def test_app_traffic_sensor_extra_state_attributes_minimal() -> None:
     assert "total_traffic_bytes" not in attrs
 
 
-def test_app_traffic_sensor_available_true() -> None:
+def test_app_traffic_sensor_available_true(make_sensor: Callable[..., Any]) -> None:
     """Test available when coordinator has data."""
-    coordinator = _make_coordinator(
-        {"11-22-33-44-55-AA": {"100": {"download": 0, "upload": 0}}}
-    )
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
+    sensor = make_sensor(data={_CLIENT_MAC: {"100": {"download": 0, "upload": 0}}})
 
     assert sensor.available is True
 
 
-def test_app_traffic_sensor_unavailable_no_app_data() -> None:
+def test_app_traffic_sensor_unavailable_no_app_data(
+    make_sensor: Callable[..., Any],
+) -> None:
     """Test unavailable when app data is missing."""
-    coordinator = _make_coordinator(
-        {"11-22-33-44-55-AA": {}}  # No app data
-    )
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
+    sensor = make_sensor(data={_CLIENT_MAC: {}})  # No app data
 
     assert sensor.available is False
 
 
-def test_app_traffic_sensor_unavailable_coordinator_failed() -> None:
+def test_app_traffic_sensor_unavailable_coordinator_failed(
+    make_sensor: Callable[..., Any],
+) -> None:
     """Test unavailable when coordinator update failed."""
-    coordinator = _make_coordinator()
-    coordinator.last_update_success = False
-    sensor = OmadaClientAppTrafficSensor(
-        coordinator=coordinator,
-        client_mac="11-22-33-44-55-AA",
-        app_id="100",
-        app_name="YouTube",
-        metric_type="download",
-    )
+    sensor = make_sensor()
+    sensor.coordinator.last_update_success = False
 
     assert sensor.available is False
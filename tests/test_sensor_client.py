@@ -2,68 +2,84 @@
 
 from __future__ import annotations
 
-import datetime as _dt
+from types import MappingProxyType, SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+
+import pytest
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from freezegun.api import FrozenDateTimeFactory
 
 from custom_components.omada_open_api.clients import process_client
 from custom_components.omada_open_api.const import DOMAIN
-from custom_components.omada_open_api.coordinator import OmadaClientCoordinator
 from custom_components.omada_open_api.sensor import CLIENT_SENSORS, OmadaClientSensor
 
 from .conftest import (
     SAMPLE_CLIENT_WIRED,
     SAMPLE_CLIENT_WIRELESS,
-    TEST_SITE_ID,
-    TEST_SITE_NAME,
+    create_stub_coordinator,
 )
 
+# Keep this module on one xdist worker so its module-scoped fixtures are
+# built once (requires --dist loadgroup).
+pytestmark = pytest.mark.xdist_group("sensor_entity")
+
 WIRELESS_MAC = "11-22-33-44-55-AA"
 WIRED_MAC = "11-22-33-44-55-BB"
 
+_CLIENT_SENSOR_BY_KEY = MappingProxyType({d.key: d for d in CLIENT_SENSORS})
+
+# Processed once at import; never mutate these, derive variants with
+# _wireless_with() instead.
+_PROCESSED_WIRELESS_TEMPLATE = process_client(SAMPLE_CLIENT_WIRELESS)
+_PROCESSED_WIRED_TEMPLATE = process_client(SAMPLE_CLIENT_WIRED)
 
-def _build_client_coordinator_data(
-    clients: dict[str, dict] | None = None,
-) -> dict:
-    """Build coordinator data dict with processed clients."""
-    return clients or {}
 
+def _wireless_with(**overrides: object) -> dict:
+    """Return a copy of the processed wireless client with fields overridden."""
+    data = _PROCESSED_WIRELESS_TEMPLATE.copy()
+    data.update(overrides)
+    return data
 
-def _processed_wireless() -> dict:
+
+@pytest.fixture(scope="module")
+def processed_wireless() -> dict:
     """Return processed wireless client data."""
-    return process_client(SAMPLE_CLIENT_WIRELESS)
+    return _PROCESSED_WIRELESS_TEMPLATE
 
 
-def _processed_wired() -> dict:
+@pytest.fixture(scope="module")
+def processed_wired() -> dict:
     """Return processed wired client data."""
-    return process_client(SAMPLE_CLIENT_WIRED)
+    return _PROCESSED_WIRED_TEMPLATE
+
+
+@pytest.fixture
+def client_data(
+    request: pytest.FixtureRequest, processed_wireless: dict, processed_wired: dict
+) -> dict:
+    """Resolve an indirect "wireless"/"wired" parameter to processed client data."""
+    return {"wireless": processed_wireless, "wired": processed_wired}[request.param]
+
+
+@pytest.fixture
+def client_coordinator() -> SimpleNamespace:
+    """Return a stub client coordinator whose data each test fills in."""
+    return create_stub_coordinator({})
 
 
 def _create_client_sensor(
-    hass: HomeAssistant,
+    coordinator: SimpleNamespace,
     client_mac: str,
     clients: dict[str, dict],
     description_key: str,
 ) -> OmadaClientSensor:
-    """Create an OmadaClientSensor with a mock coordinator."""
-    coordinator = OmadaClientCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-        selected_client_macs=list(clients.keys()),
-    )
-    coordinator.data = _build_client_coordinator_data(clients)
-
-    # Find the matching description
-    description = next(d for d in CLIENT_SENSORS if d.key == description_key)
+    """Create an OmadaClientSensor on the given coordinator."""
+    coordinator.data = clients
 
     return OmadaClientSensor(
         coordinator=coordinator,
-        description=description,
+        description=_CLIENT_SENSOR_BY_KEY[description_key],
         client_mac=client_mac,
     )
 
@@ -73,34 +89,43 @@ def _create_client_sensor(
 # ---------------------------------------------------------------------------
 
 
-async def test_client_sensor_unique_id(hass: HomeAssistant) -> None:
+def test_client_sensor_unique_id(
+    client_coordinator: SimpleNamespace,
+    processed_wireless: dict,
+) -> None:
     """Test unique_id format for client sensor."""
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
+        {WIRELESS_MAC: processed_wireless},
         "connection_status",
     )
     assert sensor.unique_id == f"{WIRELESS_MAC}_connection_status"
 
 
-async def test_client_sensor_name(hass: HomeAssistant) -> None:
+def test_client_sensor_name(
+    client_coordinator: SimpleNamespace,
+    processed_wireless: dict,
+) -> None:
     """Test sensor name is set from description."""
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
+        {WIRELESS_MAC: processed_wireless},
         "ip_address",
     )
     assert sensor.entity_description.name == "IP Address"
 
 
-async def test_client_sensor_device_info_wireless(hass: HomeAssistant) -> None:
+def test_client_sensor_device_info_wireless(
+    client_coordinator: SimpleNamespace,
+    processed_wireless: dict,
+) -> None:
     """Test device_info links to parent AP for wireless client."""
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
+        {WIRELESS_MAC: processed_wireless},
         "connection_status",
     )
     device_info = sensor._attr_device_info  # noqa: SLF001
@@ -110,12 +135,15 @@ async def test_client_sensor_device_info_wireless(hass: HomeAssistant) -> None:
     assert device_info["via_device"] == (DOMAIN, "AA-BB-CC-DD-EE-01")
 
 
-async def test_client_sensor_device_info_wired(hass: HomeAssistant) -> None:
+def test_client_sensor_device_info_wired(
+    client_coordinator: SimpleNamespace,
+    processed_wired: dict,
+) -> None:
     """Test device_info links to parent switch for wired client."""
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
+        {WIRED_MAC: processed_wired},
         "connection_status",
     )
     device_info = sensor._attr_device_info  # noqa: SLF001
@@ -130,23 +158,45 @@ async def test_client_sensor_device_info_wired(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_connection_status_connected(hass: HomeAssistant) -> None:
-    """Test connection_status returns Connected for active client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "connection_status",
-    )
-    assert sensor.native_value == "Connected"
+@pytest.mark.parametrize(
+    ("mac", "client_data", "key", "expected"),
+    [
+        (WIRELESS_MAC, "wireless", "connection_status", "Connected"),
+        (WIRELESS_MAC, "wireless", "ip_address", "192.168.1.100"),
+        (WIRELESS_MAC, "wireless", "ssid", "MyWiFi"),
+        (WIRELESS_MAC, "wireless", "connected_to", "Office AP"),
+        (WIRED_MAC, "wired", "connected_to", "Core Switch"),
+        # Traffic totals are reported in MB (bytes / 1_000_000).
+        (WIRELESS_MAC, "wireless", "downloaded", 1500.0),
+        (WIRED_MAC, "wired", "downloaded", 5000.0),
+        (WIRELESS_MAC, "wireless", "uploaded", 500.0),
+        (WIRED_MAC, "wired", "uploaded", 2000.0),
+        # Activity is reported in MB/s (bytes/s / 1_000_000).
+        (WIRELESS_MAC, "wireless", "rx_activity", 2.5),
+        (WIRELESS_MAC, "wireless", "tx_activity", 1.2),
+        (WIRELESS_MAC, "wireless", "rssi", -55),
+        (WIRELESS_MAC, "wireless", "snr", 35),
+    ],
+    indirect=["client_data"],
+)
+def test_client_sensor_native_value(
+    client_coordinator: SimpleNamespace,
+    client_data: dict,
+    mac: str,
+    key: str,
+    expected: object,
+) -> None:
+    """Test client sensors report the expected value for the sample clients."""
+    sensor = _create_client_sensor(client_coordinator, mac, {mac: client_data}, key)
+    assert sensor.native_value == expected
+    assert sensor.available is True
 
 
-async def test_connection_status_disconnected(hass: HomeAssistant) -> None:
+def test_connection_status_disconnected(client_coordinator: SimpleNamespace) -> None:
     """Test connection_status returns Disconnected for inactive client."""
-    data = _processed_wireless()
-    data["active"] = False
+    data = _wireless_with(active=False)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
         {WIRELESS_MAC: data},
         "connection_status",
@@ -154,122 +204,32 @@ async def test_connection_status_disconnected(hass: HomeAssistant) -> None:
     assert sensor.native_value == "Disconnected"
 
 
-async def test_ip_address_sensor(hass: HomeAssistant) -> None:
-    """Test ip_address sensor returns IP."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "ip_address",
-    )
-    assert sensor.native_value == "192.168.1.100"
-
-
-async def test_ssid_sensor_wireless(hass: HomeAssistant) -> None:
-    """Test SSID sensor returns SSID for wireless client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "ssid",
-    )
-    assert sensor.native_value == "MyWiFi"
-    assert sensor.available is True
-
-
-async def test_ssid_sensor_unavailable_wired(hass: HomeAssistant) -> None:
-    """Test SSID sensor is unavailable for wired client."""
+@pytest.mark.parametrize("key", ["ssid", "rssi", "snr", "signal_strength"])
+def test_wireless_only_sensor_unavailable_wired(
+    client_coordinator: SimpleNamespace,
+    processed_wired: dict,
+    key: str,
+) -> None:
+    """Test wireless-only sensors are unavailable for a wired client."""
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
-        "ssid",
+        {WIRED_MAC: processed_wired},
+        key,
     )
     assert sensor.available is False
 
 
-async def test_connected_to_wireless(hass: HomeAssistant) -> None:
-    """Test connected_to returns AP name for wireless client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "connected_to",
-    )
-    assert sensor.native_value == "Office AP"
-
-
-async def test_connected_to_wired(hass: HomeAssistant) -> None:
-    """Test connected_to returns switch name for wired client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
-        "connected_to",
-    )
-    assert sensor.native_value == "Core Switch"
-
-
 # ---------------------------------------------------------------------------
 # New traffic sensors
 # ---------------------------------------------------------------------------
 
 
-async def test_downloaded_sensor_wireless(hass: HomeAssistant) -> None:
-    """Test downloaded sensor converts bytes to MB."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "downloaded",
-    )
-    # 1_500_000_000 bytes / 1_000_000 = 1500.0 MB
-    assert sensor.native_value == 1500.0
-    assert sensor.available is True
-
-
-async def test_downloaded_sensor_wired(hass: HomeAssistant) -> None:
-    """Test downloaded sensor for wired client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
-        "downloaded",
-    )
-    # 5_000_000_000 bytes / 1_000_000 = 5000.0 MB
-    assert sensor.native_value == 5000.0
-
-
-async def test_uploaded_sensor_wireless(hass: HomeAssistant) -> None:
-    """Test uploaded sensor converts bytes to MB."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "uploaded",
-    )
-    # 500_000_000 bytes / 1_000_000 = 500.0 MB
-    assert sensor.native_value == 500.0
-
-
-async def test_uploaded_sensor_wired(hass: HomeAssistant) -> None:
-    """Test uploaded sensor for wired client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
-        "uploaded",
-    )
-    # 2_000_000_000 bytes / 1_000_000 = 2000.0 MB
-    assert sensor.native_value == 2000.0
-
-
-async def test_downloaded_unavailable_when_none(hass: HomeAssistant) -> None:
+def test_downloaded_unavailable_when_none(client_coordinator: SimpleNamespace) -> None:
     """Test downloaded sensor unavailable when traffic_down is None."""
-    data = _processed_wireless()
-    data["traffic_down"] = None
+    data = _wireless_with(traffic_down=None)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
         {WIRELESS_MAC: data},
         "downloaded",
@@ -278,36 +238,11 @@ async def test_downloaded_unavailable_when_none(hass: HomeAssistant) -> None:
     assert sensor.native_value is None
 
 
-async def test_rx_activity_sensor(hass: HomeAssistant) -> None:
-    """Test RX activity sensor converts bytes/s to MB/s."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "rx_activity",
-    )
-    # 2_500_000 bytes/s / 1_000_000 = 2.50 MB/s
-    assert sensor.native_value == 2.5
-
-
-async def test_tx_activity_sensor(hass: HomeAssistant) -> None:
-    """Test TX activity sensor converts bytes/s to MB/s."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "tx_activity",
-    )
-    # 1_200_000 bytes/s / 1_000_000 = 1.20 MB/s
-    assert sensor.native_value == 1.2
-
-
-async def test_rx_activity_unavailable_when_none(hass: HomeAssistant) -> None:
+def test_rx_activity_unavailable_when_none(client_coordinator: SimpleNamespace) -> None:
     """Test RX activity sensor defaults to 0 for active client with None activity."""
-    data = _processed_wireless()
-    data["activity"] = None
+    data = _wireless_with(activity=None)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
         {WIRELESS_MAC: data},
         "rx_activity",
@@ -317,94 +252,55 @@ async def test_rx_activity_unavailable_when_none(hass: HomeAssistant) -> None:
     assert sensor.native_value == 0.0
 
 
-# ---------------------------------------------------------------------------
-# RSSI and SNR sensors
-# ---------------------------------------------------------------------------
-
-
-async def test_rssi_sensor_wireless(hass: HomeAssistant) -> None:
-    """Test RSSI sensor returns value for wireless client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "rssi",
-    )
-    assert sensor.native_value == -55
-    assert sensor.available is True
-
-
-async def test_rssi_sensor_unavailable_wired(hass: HomeAssistant) -> None:
-    """Test RSSI sensor unavailable for wired client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
-        "rssi",
-    )
-    assert sensor.available is False
-
-
-async def test_snr_sensor_wireless(hass: HomeAssistant) -> None:
-    """Test SNR sensor returns value for wireless client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
-        "snr",
-    )
-    assert sensor.native_value == 35
-    assert sensor.available is True
-
-
-async def test_snr_sensor_unavailable_wired(hass: HomeAssistant) -> None:
-    """Test SNR sensor unavailable for wired client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
-        "snr",
-    )
-    assert sensor.available is False
-
-
 # ---------------------------------------------------------------------------
 # Uptime sensor
 # ---------------------------------------------------------------------------
 
+_FROZEN_NOW = "2024-01-01T00:00:00+00:00"
+# Frozen clock minus the sample uptimes (3600 s wireless, 7200 s wired).
+_EXPECTED_BOOT_WIRELESS = "2023-12-31T23:00:00+00:00"
+_EXPECTED_BOOT_WIRED = "2023-12-31T22:00:00+00:00"
+
 
-async def test_client_uptime_wireless(hass: HomeAssistant) -> None:
-    """Test uptime sensor returns datetime (boot time)."""
+def test_client_uptime_wireless(
+    client_coordinator: SimpleNamespace,
+    processed_wireless: dict,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test uptime sensor returns the boot time (now minus uptime)."""
+    freezer.move_to(_FROZEN_NOW)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
+        {WIRELESS_MAC: processed_wireless},
         "client_uptime",
     )
-    value = sensor.native_value
-    assert isinstance(value, _dt.datetime)
-    assert value.tzinfo is not None
+    assert sensor.native_value.isoformat() == _EXPECTED_BOOT_WIRELESS
 
 
-async def test_client_uptime_wired(hass: HomeAssistant) -> None:
-    """Test uptime sensor for wired client returns datetime."""
+def test_client_uptime_wired(
+    client_coordinator: SimpleNamespace,
+    processed_wired: dict,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test uptime sensor for wired client returns the boot time."""
+    freezer.move_to(_FROZEN_NOW)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
+        {WIRED_MAC: processed_wired},
         "client_uptime",
     )
-    value = sensor.native_value
-    assert isinstance(value, _dt.datetime)
-    assert value.tzinfo is not None
+    assert sensor.native_value.isoformat() == _EXPECTED_BOOT_WIRED
 
 
-async def test_client_uptime_unavailable_when_none(hass: HomeAssistant) -> None:
+def test_client_uptime_unavailable_when_none(
+    client_coordinator: SimpleNamespace,
+) -> None:
     """Test uptime sensor unavailable when uptime is None."""
-    data = _processed_wireless()
-    data["uptime"] = None
+    data = _wireless_with(uptime=None)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
         {WIRELESS_MAC: data},
         "client_uptime",
@@ -417,12 +313,15 @@ async def test_client_uptime_unavailable_when_none(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_client_sensor_missing_client_data(hass: HomeAssistant) -> None:
+def test_client_sensor_missing_client_data(
+    client_coordinator: SimpleNamespace,
+    processed_wireless: dict,
+) -> None:
     """Test sensor returns None when client not in coordinator data."""
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
+        {WIRELESS_MAC: processed_wireless},
         "ip_address",
     )
     # Remove client from data to simulate disappearance
@@ -431,12 +330,15 @@ async def test_client_sensor_missing_client_data(hass: HomeAssistant) -> None:
     assert sensor.available is False
 
 
-async def test_client_sensor_coordinator_failure(hass: HomeAssistant) -> None:
+def test_client_sensor_coordinator_failure(
+    client_coordinator: SimpleNamespace,
+    processed_wireless: dict,
+) -> None:
     """Test sensor unavailable when coordinator update fails."""
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
-        {WIRELESS_MAC: _processed_wireless()},
+        {WIRELESS_MAC: processed_wireless},
         "ip_address",
     )
     sensor.coordinator.last_update_success = False
@@ -448,12 +350,13 @@ async def test_client_sensor_coordinator_failure(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_rx_activity_unavailable_when_inactive(hass: HomeAssistant) -> None:
+def test_rx_activity_unavailable_when_inactive(
+    client_coordinator: SimpleNamespace,
+) -> None:
     """Test RX activity sensor unavailable when client is inactive."""
-    data = _processed_wireless()
-    data["active"] = False
+    data = _wireless_with(active=False)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
         {WIRELESS_MAC: data},
         "rx_activity",
@@ -461,12 +364,13 @@ async def test_rx_activity_unavailable_when_inactive(hass: HomeAssistant) -> Non
     assert sensor.available is False
 
 
-async def test_tx_activity_unavailable_when_inactive(hass: HomeAssistant) -> None:
+def test_tx_activity_unavailable_when_inactive(
+    client_coordinator: SimpleNamespace,
+) -> None:
     """Test TX activity sensor unavailable when client is inactive."""
-    data = _processed_wireless()
-    data["active"] = False
+    data = _wireless_with(active=False)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
         {WIRELESS_MAC: data},
         "tx_activity",
@@ -474,12 +378,11 @@ async def test_tx_activity_unavailable_when_inactive(hass: HomeAssistant) -> Non
     assert sensor.available is False
 
 
-async def test_tx_activity_defaults_to_zero(hass: HomeAssistant) -> None:
+def test_tx_activity_defaults_to_zero(client_coordinator: SimpleNamespace) -> None:
     """Test TX activity sensor defaults to 0 when field is None."""
-    data = _processed_wireless()
-    data["upload_activity"] = None
+    data = _wireless_with(upload_activity=None)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         WIRELESS_MAC,
         {WIRELESS_MAC: data},
         "tx_activity",
@@ -488,19 +391,8 @@ async def test_tx_activity_defaults_to_zero(hass: HomeAssistant) -> None:
     assert sensor.native_value == 0.0
 
 
-async def test_signal_strength_unavailable_wired(hass: HomeAssistant) -> None:
-    """Test signal_strength unavailable for wired client."""
-    sensor = _create_client_sensor(
-        hass,
-        WIRED_MAC,
-        {WIRED_MAC: _processed_wired()},
-        "signal_strength",
-    )
-    assert sensor.available is False
-
-
-async def test_client_sensor_device_info_gateway_fallback(
-    hass: HomeAssistant,
+def test_client_sensor_device_info_gateway_fallback(
+    client_coordinator: SimpleNamespace,
 ) -> None:
     """Test device_info uses gateway_mac when no AP or switch."""
     gateway_client = {
@@ -519,7 +411,7 @@ async def test_client_sensor_device_info_gateway_fallback(
     mac = "AA-BB-CC-00-00-01"
     processed = process_client(gateway_client)
     sensor = _create_client_sensor(
-        hass,
+        client_coordinator,
         mac,
         {mac: processed},
         "connection_status",
@@ -2,70 +2,69 @@
 
 from __future__ import annotations
 
-import datetime as _dt
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+
+import pytest
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from freezegun.api import FrozenDateTimeFactory
 
 from custom_components.omada_open_api.const import DOMAIN
-from custom_components.omada_open_api.coordinator import OmadaSiteCoordinator
-from custom_components.omada_open_api.devices import process_device
 from custom_components.omada_open_api.sensor import (
-    AP_BAND_CLIENT_SENSORS,
-    DEVICE_SENSORS,
     OmadaDeviceSensor,
+    OmadaSensorEntityDescription,
 )
 
-from .conftest import (
-    SAMPLE_DEVICE_AP,
-    SAMPLE_DEVICE_GATEWAY,
-    SAMPLE_DEVICE_SWITCH,
-    TEST_SITE_ID,
-    TEST_SITE_NAME,
-)
+from .conftest import AP_BAND_SENSOR_BY_KEY, DEVICE_SENSOR_BY_KEY, create_device_sensor
+
+# Keep this module on one xdist worker so its module-scoped fixtures are
+# built once (requires --dist loadgroup).
+pytestmark = pytest.mark.xdist_group("sensor_entity")
 
 AP_MAC = "AA-BB-CC-DD-EE-01"
 SWITCH_MAC = "AA-BB-CC-DD-EE-02"
 GATEWAY_MAC = "AA-BB-CC-DD-EE-03"
 
+_DESC_CPU_UTIL = DEVICE_SENSOR_BY_KEY["cpu_util"]
+_DESC_UPTIME = DEVICE_SENSOR_BY_KEY["uptime"]
+_DESC_CLIENT_NUM = DEVICE_SENSOR_BY_KEY["client_num"]
+_DESC_DETAIL_STATUS = DEVICE_SENSOR_BY_KEY["detail_status"]
+_DESC_WIRED_CLIENTS = DEVICE_SENSOR_BY_KEY["wired_clients"]
+_DESC_WIRELESS_CLIENTS = DEVICE_SENSOR_BY_KEY["wireless_clients"]
+_DESC_CLIENTS_2G = AP_BAND_SENSOR_BY_KEY["clients_2g"]
 
-def _build_coordinator_data(
-    devices: dict[str, dict] | None = None,
-) -> dict:
-    """Build coordinator data dict with devices."""
-    return {
-        "devices": devices or {},
-        "poe_ports": {},
-        "poe_budget": {},
-        "site_id": TEST_SITE_ID,
-        "site_name": TEST_SITE_NAME,
-    }
 
+@pytest.fixture
+def ap_cpu_sensor(processed_ap: dict) -> OmadaDeviceSensor:
+    """Return the AP cpu_util sensor shared by the identity and edge-case tests."""
+    return create_device_sensor(AP_MAC, processed_ap, _DESC_CPU_UTIL)
+
+
+@pytest.fixture(scope="module")
+def processed_unknown(processed_ap: dict) -> dict:
+    """Return the processed AP reporting a device type with no label."""
+    return {**processed_ap, "type": "router"}
+
+
+_MAC_BY_KIND = {
+    "ap": AP_MAC,
+    "switch": SWITCH_MAC,
+    "gateway": GATEWAY_MAC,
+    "unknown": AP_MAC,
+}
 
-def _create_device_sensor(
-    hass: HomeAssistant,
-    device_mac: str,
-    devices: dict[str, dict],
-    description_key: str,
-    sensor_list: tuple = DEVICE_SENSORS,
-) -> OmadaDeviceSensor:
-    """Create an OmadaDeviceSensor with a mock coordinator."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    coordinator.data = _build_coordinator_data(devices)
 
-    description = next(d for d in sensor_list if d.key == description_key)
+@pytest.fixture(scope="module")
+def device_sensor(request: pytest.FixtureRequest) -> OmadaDeviceSensor:
+    """Return a read-only sensor for an indirect ``(kind, sensor_key)`` param.
 
-    return OmadaDeviceSensor(
-        coordinator=coordinator,
-        description=description,
-        device_mac=device_mac,
+    Module-scoped, so tests requesting the same pair share one instance;
+    consumers must not mutate the sensor or its coordinator.
+    """
+    kind, key = request.param
+    device_data = request.getfixturevalue(f"processed_{kind}")
+    return create_device_sensor(
+        _MAC_BY_KIND[kind], device_data, DEVICE_SENSOR_BY_KEY[key]
     )
 
 
@@ -74,60 +73,60 @@ def _create_device_sensor(
 # ---------------------------------------------------------------------------
 
 
-async def test_client_num_sensor(hass: HomeAssistant) -> None:
+_DUMMY_CLIENTS = tuple(
+    {
+        "name": f"Client {i}",
+        "mac": f"CC:CC:CC:CC:00:{i:02X}",
+        "ip": f"10.0.0.{i}",
+        "wireless": True,
+    }
+    for i in range(12)
+)
+
+
+def test_client_num_sensor(processed_ap: dict) -> None:
     """Test client_num sensor returns count from connected_clients list."""
-    data = process_device(SAMPLE_DEVICE_AP)
     # The sensor now uses len(connected_clients), not raw client_num.
-    data["connected_clients"] = [
-        {
-            "name": f"Client {i}",
-            "mac": f"CC:CC:CC:CC:00:{i:02X}",
-            "ip": f"10.0.0.{i}",
-            "wireless": True,
-        }
-        for i in range(12)
-    ]
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "client_num")
+    data = {**processed_ap, "connected_clients": _DUMMY_CLIENTS}
+    sensor = create_device_sensor(AP_MAC, data, _DESC_CLIENT_NUM)
     assert sensor.native_value == 12
 
 
-async def test_uptime_sensor_string(hass: HomeAssistant) -> None:
-    """Test uptime sensor returns datetime (boot time)."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "uptime")
-    value = sensor.native_value
-    assert isinstance(value, _dt.datetime)
-    assert value.tzinfo is not None
+_FROZEN_NOW = "2024-01-01T00:00:00+00:00"
+
 
+def test_uptime_sensor_string(
+    processed_ap: dict,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test uptime sensor returns the boot time for a formatted uptime."""
+    freezer.move_to(_FROZEN_NOW)
+    sensor = create_device_sensor(AP_MAC, processed_ap, _DESC_UPTIME)
+    # "2day(s) 5h 30m 10s" before the frozen clock.
+    assert sensor.native_value.isoformat() == "2023-12-29T18:29:50+00:00"
 
-async def test_uptime_sensor_int(hass: HomeAssistant) -> None:
-    """Test uptime sensor returns datetime for integer uptime."""
-    data = process_device(SAMPLE_DEVICE_SWITCH)
-    sensor = _create_device_sensor(hass, SWITCH_MAC, {SWITCH_MAC: data}, "uptime")
-    value = sensor.native_value
-    assert isinstance(value, _dt.datetime)
-    assert value.tzinfo is not None
 
+def test_uptime_sensor_int(
+    processed_switch: dict,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test uptime sensor returns the boot time for integer uptime."""
+    freezer.move_to(_FROZEN_NOW)
+    sensor = create_device_sensor(SWITCH_MAC, processed_switch, _DESC_UPTIME)
+    # 90000 s before the frozen clock.
+    assert sensor.native_value.isoformat() == "2023-12-30T23:00:00+00:00"
 
-async def test_cpu_util_sensor(hass: HomeAssistant) -> None:
+
+def test_cpu_util_sensor(ap_cpu_sensor: OmadaDeviceSensor) -> None:
     """Test CPU utilization sensor."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "cpu_util")
+    sensor = ap_cpu_sensor
     assert sensor.native_value == 15
 
 
-async def test_mem_util_sensor(hass: HomeAssistant) -> None:
+@pytest.mark.parametrize("device_sensor", [("switch", "mem_util")], indirect=True)
+def test_mem_util_sensor(device_sensor: OmadaDeviceSensor) -> None:
     """Test memory utilization sensor."""
-    data = process_device(SAMPLE_DEVICE_SWITCH)
-    sensor = _create_device_sensor(hass, SWITCH_MAC, {SWITCH_MAC: data}, "mem_util")
-    assert sensor.native_value == 30
-
-
-async def test_device_type_sensor(hass: HomeAssistant) -> None:
-    """Test device type sensor returns human-readable label."""
-    data = process_device(SAMPLE_DEVICE_SWITCH)
-    sensor = _create_device_sensor(hass, SWITCH_MAC, {SWITCH_MAC: data}, "device_type")
-    assert sensor.native_value == "Switch"
+    assert device_sensor.native_value == 30
 
 
 # ---------------------------------------------------------------------------
@@ -135,59 +134,27 @@ async def test_device_type_sensor(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_detail_status_connected(hass: HomeAssistant) -> None:
-    """Test detail_status returns human-readable string."""
-    ap = dict(SAMPLE_DEVICE_AP)
-    ap["detailStatus"] = 14
-    data = process_device(ap)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "detail_status")
-    assert sensor.native_value == "Connected"
-
-
-async def test_detail_status_disconnected(hass: HomeAssistant) -> None:
-    """Test detail_status for disconnected device."""
-    ap = dict(SAMPLE_DEVICE_AP)
-    ap["detailStatus"] = 0
-    data = process_device(ap)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "detail_status")
-    assert sensor.native_value == "Disconnected"
-
-
-async def test_detail_status_upgrading(hass: HomeAssistant) -> None:
-    """Test detail_status for upgrading device."""
-    ap = dict(SAMPLE_DEVICE_AP)
-    ap["detailStatus"] = 12
-    data = process_device(ap)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "detail_status")
-    assert sensor.native_value == "Upgrading"
-
-
-async def test_detail_status_heartbeat_missed(hass: HomeAssistant) -> None:
-    """Test detail_status for heartbeat missed."""
-    sw = dict(SAMPLE_DEVICE_SWITCH)
-    sw["detailStatus"] = 30
-    data = process_device(sw)
-    sensor = _create_device_sensor(
-        hass, SWITCH_MAC, {SWITCH_MAC: data}, "detail_status"
-    )
-    assert sensor.native_value == "Heartbeat Missed"
-
-
-async def test_detail_status_unknown_code(hass: HomeAssistant) -> None:
-    """Test detail_status with unknown code."""
-    ap = dict(SAMPLE_DEVICE_AP)
-    ap["detailStatus"] = 999
-    data = process_device(ap)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "detail_status")
-    assert sensor.native_value == "Unknown (999)"
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        (14, "Connected"),
+        (0, "Disconnected"),
+        (12, "Upgrading"),
+        (30, "Heartbeat Missed"),
+        (999, "Unknown (999)"),
+    ],
+)
+def test_detail_status(processed_ap: dict, code: int, expected: str) -> None:
+    """Test detail_status maps status codes to human-readable strings."""
+    data = {**processed_ap, "detail_status": code}
+    sensor = create_device_sensor(AP_MAC, data, _DESC_DETAIL_STATUS)
+    assert sensor.native_value == expected
 
 
-async def test_detail_status_unavailable_when_none(hass: HomeAssistant) -> None:
+def test_detail_status_unavailable_when_none(processed_ap: dict) -> None:
     """Test detail_status unavailable when not in data."""
-    ap = dict(SAMPLE_DEVICE_AP)
-    del ap["detailStatus"]
-    data = process_device(ap)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "detail_status")
+    data = {**processed_ap, "detail_status": None}
+    sensor = create_device_sensor(AP_MAC, data, _DESC_DETAIL_STATUS)
     assert sensor.available is False
 
 
@@ -196,59 +163,40 @@ async def test_detail_status_unavailable_when_none(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _ap_data_with_bands() -> dict:
+@pytest.fixture(scope="module")
+def ap_data_with_bands(processed_ap: dict) -> dict:
     """Return AP device data with per-band client counts."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    data["client_num_2g"] = 5
-    data["client_num_5g"] = 7
-    data["client_num_5g2"] = 0
-    data["client_num_6g"] = 3
-    return data
-
-
-async def test_clients_2g_sensor(hass: HomeAssistant) -> None:
-    """Test 2.4 GHz client count sensor."""
-    data = _ap_data_with_bands()
-    sensor = _create_device_sensor(
-        hass, AP_MAC, {AP_MAC: data}, "clients_2g", AP_BAND_CLIENT_SENSORS
-    )
-    assert sensor.native_value == 5
-
-
-async def test_clients_5g_sensor(hass: HomeAssistant) -> None:
-    """Test 5 GHz client count sensor."""
-    data = _ap_data_with_bands()
-    sensor = _create_device_sensor(
-        hass, AP_MAC, {AP_MAC: data}, "clients_5g", AP_BAND_CLIENT_SENSORS
-    )
-    assert sensor.native_value == 7
-
-
-async def test_clients_5g2_sensor(hass: HomeAssistant) -> None:
-    """Test 5 GHz-2 client count sensor."""
-    data = _ap_data_with_bands()
-    sensor = _create_device_sensor(
-        hass, AP_MAC, {AP_MAC: data}, "clients_5g2", AP_BAND_CLIENT_SENSORS
-    )
-    assert sensor.native_value == 0
+    return {
+        **processed_ap,
+        "client_num_2g": 5,
+        "client_num_5g": 7,
+        "client_num_5g2": 0,
+        "client_num_6g": 3,
+    }
 
 
-async def test_clients_6g_sensor(hass: HomeAssistant) -> None:
-    """Test 6 GHz client count sensor."""
-    data = _ap_data_with_bands()
-    sensor = _create_device_sensor(
-        hass, AP_MAC, {AP_MAC: data}, "clients_6g", AP_BAND_CLIENT_SENSORS
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [("clients_2g", 5), ("clients_5g", 7), ("clients_5g2", 0), ("clients_6g", 3)],
+)
+def test_clients_band_sensor(
+    ap_data_with_bands: dict,
+    key: str,
+    expected: int,
+) -> None:
+    """Test per-band client count sensors."""
+    sensor = create_device_sensor(
+        AP_MAC,
+        ap_data_with_bands,
+        AP_BAND_SENSOR_BY_KEY[key],
     )
-    assert sensor.native_value == 3
+    assert sensor.native_value == expected
 
 
-async def test_band_sensor_unavailable_without_data(hass: HomeAssistant) -> None:
+def test_band_sensor_unavailable_without_data(processed_ap: dict) -> None:
     """Test per-band sensor unavailable when data not populated."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    # No client_num_2g key in data
-    sensor = _create_device_sensor(
-        hass, AP_MAC, {AP_MAC: data}, "clients_2g", AP_BAND_CLIENT_SENSORS
-    )
+    # No client_num_2g key in the processed AP data
+    sensor = create_device_sensor(AP_MAC, processed_ap, _DESC_CLIENTS_2G)
     assert sensor.available is False
 
 
@@ -257,31 +205,26 @@ async def test_band_sensor_unavailable_without_data(hass: HomeAssistant) -> None
 # ---------------------------------------------------------------------------
 
 
-async def test_device_sensor_unique_id(hass: HomeAssistant) -> None:
+def test_device_sensor_unique_id(ap_cpu_sensor: OmadaDeviceSensor) -> None:
     """Test unique_id format for device sensor."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "cpu_util")
+    sensor = ap_cpu_sensor
     assert sensor.unique_id == f"{AP_MAC}_cpu_util"
 
 
-async def test_device_sensor_device_info_ap(hass: HomeAssistant) -> None:
+@pytest.mark.parametrize("device_sensor", [("ap", "client_num")], indirect=True)
+def test_device_sensor_device_info_ap(device_sensor: OmadaDeviceSensor) -> None:
     """Test device_info for AP."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "client_num")
-    device_info = sensor._attr_device_info  # noqa: SLF001
+    device_info = device_sensor._attr_device_info  # noqa: SLF001
     assert (DOMAIN, AP_MAC) in device_info["identifiers"]
     assert device_info["name"] == "Office AP"
     assert device_info["manufacturer"] == "TP-Link"
     assert device_info["model"] == "EAP660 HD"
 
 
-async def test_device_sensor_device_info_gateway(hass: HomeAssistant) -> None:
+@pytest.mark.parametrize("device_sensor", [("gateway", "device_type")], indirect=True)
+def test_device_sensor_device_info_gateway(device_sensor: OmadaDeviceSensor) -> None:
     """Test device_info for gateway has no via_device."""
-    data = process_device(SAMPLE_DEVICE_GATEWAY)
-    sensor = _create_device_sensor(
-        hass, GATEWAY_MAC, {GATEWAY_MAC: data}, "device_type"
-    )
-    device_info = sensor._attr_device_info  # noqa: SLF001
+    device_info = device_sensor._attr_device_info  # noqa: SLF001
     assert "via_device" not in device_info
 
 
@@ -290,19 +233,17 @@ async def test_device_sensor_device_info_gateway(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_device_sensor_missing_device_data(hass: HomeAssistant) -> None:
+def test_device_sensor_missing_device_data(ap_cpu_sensor: OmadaDeviceSensor) -> None:
     """Test sensor returns None when device not in coordinator data."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "cpu_util")
-    sensor.coordinator.data = _build_coordinator_data({})
+    sensor = ap_cpu_sensor
+    sensor.coordinator.data["devices"] = {}
     assert sensor.native_value is None
     assert sensor.available is False
 
 
-async def test_device_sensor_coordinator_failure(hass: HomeAssistant) -> None:
+def test_device_sensor_coordinator_failure(ap_cpu_sensor: OmadaDeviceSensor) -> None:
     """Test sensor unavailable when coordinator update fails."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "cpu_util")
+    sensor = ap_cpu_sensor
     sensor.coordinator.last_update_success = False
     assert sensor.available is False
 
@@ -312,28 +253,20 @@ async def test_device_sensor_coordinator_failure(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_device_type_sensor_ap(hass: HomeAssistant) -> None:
-    """Test device type sensor returns 'Access Point' for ap type."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "device_type")
-    assert sensor.native_value == "Access Point"
-
-
-async def test_device_type_sensor_gateway(hass: HomeAssistant) -> None:
-    """Test device type sensor returns 'Gateway' for gateway type."""
-    data = process_device(SAMPLE_DEVICE_GATEWAY)
-    sensor = _create_device_sensor(
-        hass, GATEWAY_MAC, {GATEWAY_MAC: data}, "device_type"
-    )
-    assert sensor.native_value == "Gateway"
-
-
-async def test_device_type_sensor_unknown_type(hass: HomeAssistant) -> None:
-    """Test device type sensor falls back to raw value for unknown type."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    data["type"] = "router"
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "device_type")
-    assert sensor.native_value == "router"
+@pytest.mark.parametrize(
+    ("device_sensor", "expected"),
+    [
+        (("ap", "device_type"), "Access Point"),
+        (("switch", "device_type"), "Switch"),
+        (("gateway", "device_type"), "Gateway"),
+        (("unknown", "device_type"), "router"),
+    ],
+    ids=["ap", "switch", "gateway", "unknown"],
+    indirect=["device_sensor"],
+)
+def test_device_type_sensor(device_sensor: OmadaDeviceSensor, expected: str) -> None:
+    """Test device type sensor returns a label, or the raw type if unknown."""
+    assert device_sensor.native_value == expected
 
 
 # ---------------------------------------------------------------------------
@@ -341,11 +274,11 @@ async def test_device_type_sensor_unknown_type(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_uptime_unavailable_when_none(hass: HomeAssistant) -> None:
+def test_uptime_unavailable_when_none(processed_ap: dict) -> None:
     """Test uptime sensor unavailable when uptime is None."""
-    data = process_device(SAMPLE_DEVICE_AP)
+    data = dict(processed_ap)
     data["uptime"] = None
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "uptime")
+    sensor = create_device_sensor(AP_MAC, data, _DESC_UPTIME)
     assert sensor.available is False
 
 
@@ -377,100 +310,60 @@ _SAMPLE_CONNECTED_CLIENTS: list[dict] = [
 ]
 
 
-async def test_client_num_attrs(hass: HomeAssistant) -> None:
-    """Test client_num sensor has clients attribute list."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    data["connected_clients"] = _SAMPLE_CONNECTED_CLIENTS
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "client_num")
+@pytest.fixture(scope="module")
+def ap_data_with_clients(ap_data_with_bands: dict) -> dict:
+    """Return AP device data with the sample connected clients attached."""
+    return {**ap_data_with_bands, "connected_clients": _SAMPLE_CONNECTED_CLIENTS}
+
+
+@pytest.mark.parametrize(
+    ("description", "expected_names"),
+    [
+        (_DESC_CLIENT_NUM, ["Laptop", "Phone", "Printer"]),
+        (_DESC_WIRED_CLIENTS, ["Printer"]),
+        (_DESC_WIRELESS_CLIENTS, ["Laptop", "Phone"]),
+        (_DESC_CLIENTS_2G, ["Phone"]),
+        (AP_BAND_SENSOR_BY_KEY["clients_5g"], ["Laptop"]),
+    ],
+    ids=["all", "wired", "wireless", "2g", "5g"],
+)
+def test_client_list_attrs(
+    ap_data_with_clients: dict,
+    description: OmadaSensorEntityDescription,
+    expected_names: list[str],
+) -> None:
+    """Test client list attributes contain only the matching clients."""
+    sensor = create_device_sensor(AP_MAC, ap_data_with_clients, description)
     attrs = sensor.extra_state_attributes
     assert attrs is not None
-    assert len(attrs["clients"]) == 3
-    assert attrs["clients"][0]["name"] == "Laptop"
+    assert [c["name"] for c in attrs["clients"]] == expected_names
 
 
-async def test_wired_clients_sensor(hass: HomeAssistant) -> None:
+def test_wired_clients_sensor(processed_switch: dict) -> None:
     """Test wired_clients sensor returns only wired count."""
-    data = process_device(SAMPLE_DEVICE_SWITCH)
+    data = dict(processed_switch)
     data["connected_clients"] = _SAMPLE_CONNECTED_CLIENTS
-    sensor = _create_device_sensor(
-        hass, SWITCH_MAC, {SWITCH_MAC: data}, "wired_clients"
-    )
+    sensor = create_device_sensor(SWITCH_MAC, data, _DESC_WIRED_CLIENTS)
     assert sensor.native_value == 1
 
 
-async def test_wired_clients_attrs(hass: HomeAssistant) -> None:
-    """Test wired_clients sensor has only wired clients in attribute."""
-    data = process_device(SAMPLE_DEVICE_SWITCH)
-    data["connected_clients"] = _SAMPLE_CONNECTED_CLIENTS
-    sensor = _create_device_sensor(
-        hass, SWITCH_MAC, {SWITCH_MAC: data}, "wired_clients"
-    )
-    attrs = sensor.extra_state_attributes
-    assert attrs is not None
-    assert len(attrs["clients"]) == 1
-    assert attrs["clients"][0]["name"] == "Printer"
-
-
-async def test_wireless_clients_sensor(hass: HomeAssistant) -> None:
+def test_wireless_clients_sensor(processed_ap: dict) -> None:
     """Test wireless_clients sensor returns only wireless count."""
-    data = process_device(SAMPLE_DEVICE_AP)
+    data = dict(processed_ap)
     data["connected_clients"] = _SAMPLE_CONNECTED_CLIENTS
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "wireless_clients")
+    sensor = create_device_sensor(AP_MAC, data, _DESC_WIRELESS_CLIENTS)
     assert sensor.native_value == 2
 
 
-async def test_wireless_clients_attrs(hass: HomeAssistant) -> None:
-    """Test wireless_clients sensor has only wireless clients in attribute."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    data["connected_clients"] = _SAMPLE_CONNECTED_CLIENTS
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "wireless_clients")
-    attrs = sensor.extra_state_attributes
-    assert attrs is not None
-    assert len(attrs["clients"]) == 2
-    assert {c["name"] for c in attrs["clients"]} == {"Laptop", "Phone"}
-
-
-async def test_client_num_empty_list(hass: HomeAssistant) -> None:
+def test_client_num_empty_list(processed_switch: dict) -> None:
     """Test client_num returns 0 when connected_clients is empty."""
-    data = process_device(SAMPLE_DEVICE_SWITCH)
+    data = dict(processed_switch)
     data["connected_clients"] = []
-    sensor = _create_device_sensor(hass, SWITCH_MAC, {SWITCH_MAC: data}, "client_num")
+    sensor = create_device_sensor(SWITCH_MAC, data, _DESC_CLIENT_NUM)
     assert sensor.native_value == 0
 
 
-async def test_device_sensor_no_attrs_when_fn_none(hass: HomeAssistant) -> None:
+def test_device_sensor_no_attrs_when_fn_none(ap_cpu_sensor: OmadaDeviceSensor) -> None:
     """Test sensors without attrs_fn return None for extra_state_attributes."""
-    data = process_device(SAMPLE_DEVICE_AP)
-    sensor = _create_device_sensor(hass, AP_MAC, {AP_MAC: data}, "cpu_util")
+    sensor = ap_cpu_sensor
     assert sensor.extra_state_attributes is None
-
-
-# ---------------------------------------------------------------------------
-# Per-band client list attributes
-# ---------------------------------------------------------------------------
-
-
-async def test_band_2g_client_attrs(hass: HomeAssistant) -> None:
-    """Test 2.4 GHz sensor attrs contain only radio_id=0 clients."""
-    data = _ap_data_with_bands()
-    data["connected_clients"] = _SAMPLE_CONNECTED_CLIENTS
-    sensor = _create_device_sensor(
-        hass, AP_MAC, {AP_MAC: data}, "clients_2g", AP_BAND_CLIENT_SENSORS
-    )
-    attrs = sensor.extra_state_attributes
-    assert attrs is not None
-    assert len(attrs["clients"]) == 1
-    assert attrs["clients"][0]["name"] == "Phone"
-
-
-async def test_band_5g_client_attrs(hass: HomeAssistant) -> None:
-    """Test 5 GHz sensor attrs contain only radio_id=1 clients."""
-    data = _ap_data_with_bands()
-    data["connected_clients"] = _SAMPLE_CONNECTED_CLIENTS
-    sensor = _create_device_sensor(
-        hass, AP_MAC, {AP_MAC: data}, "clients_5g", AP_BAND_CLIENT_SENSORS
-    )
-    attrs = sensor.extra_state_attributes
-    assert attrs is not None
-    assert len(attrs["clients"]) == 1
-    assert attrs["clients"][0]["name"] == "Laptop"
@@ -2,192 +2,189 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
-from unittest.mock import MagicMock
+
+import pytest
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Mapping, Sequence
 
 from custom_components.omada_open_api.const import DOMAIN
-from custom_components.omada_open_api.coordinator import OmadaSiteCoordinator
 from custom_components.omada_open_api.sensor import SITE_SENSORS, OmadaSiteSensor
 
-from .conftest import TEST_SITE_ID, TEST_SITE_NAME
+from .conftest import TEST_SITE_ID, TEST_SITE_NAME, create_stub_sensor
+
+_SITE_SENSOR_BY_KEY = MappingProxyType({d.key: d for d in SITE_SENSORS})
+_SITE_IDENTIFIER = (DOMAIN, f"site_{TEST_SITE_ID}")
+
+# Sample client data for testing (read-only, shared by every test)
+SAMPLE_CLIENTS: tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(client)
+    for client in (
+        {
+            "name": "Laptop",
+            "mac": "CC:00:00:00:00:01",
+            "ip": "10.0.0.1",
+            "wireless": True,
+        },
+        {
+            "name": "Phone",
+            "mac": "CC:00:00:00:00:02",
+            "ip": "10.0.0.2",
+            "wireless": True,
+        },
+        {
+            "name": "Printer",
+            "mac": "CC:00:00:00:00:03",
+            "ip": "10.0.0.3",
+            "wireless": False,
+        },
+        {
+            "name": "Desktop",
+            "mac": "CC:00:00:00:00:04",
+            "ip": "10.0.0.4",
+            "wireless": False,
+        },
+        {
+            "name": "Tablet",
+            "mac": "CC:00:00:00:00:05",
+            "ip": "10.0.0.5",
+            "wireless": True,
+        },
+    )
+)
 
-# Sample client data for testing
-SAMPLE_CLIENTS: list[dict[str, Any]] = [
-    {"name": "Laptop", "mac": "CC:00:00:00:00:01", "ip": "10.0.0.1", "wireless": True},
-    {"name": "Phone", "mac": "CC:00:00:00:00:02", "ip": "10.0.0.2", "wireless": True},
+SAMPLE_POE_BUDGET: Mapping[str, Mapping[str, Any]] = MappingProxyType(
     {
-        "name": "Printer",
-        "mac": "CC:00:00:00:00:03",
-        "ip": "10.0.0.3",
-        "wireless": False,
-    },
+        "AA-BB-CC-DD-EE-02": MappingProxyType(
+            {
+                "total_power": 250.0,
+                "total_power_used": 45.3,
+                "total_percent_used": 18.1,
+            }
+        ),
+        "AA-BB-CC-DD-EE-04": MappingProxyType(
+            {
+                "total_power": 370.0,
+                "total_power_used": 112.7,
+                "total_percent_used": 30.5,
+            }
+        ),
+    }
+)
+
+_EMPTY_POE_BUDGET: MappingProxyType[str, Any] = MappingProxyType({})
+
+_EMPTY_SITE_DATA: MappingProxyType[str, Any] = MappingProxyType(
     {
-        "name": "Desktop",
-        "mac": "CC:00:00:00:00:04",
-        "ip": "10.0.0.4",
-        "wireless": False,
-    },
-    {"name": "Tablet", "mac": "CC:00:00:00:00:05", "ip": "10.0.0.5", "wireless": True},
-]
-
-SAMPLE_POE_BUDGET: dict[str, dict[str, Any]] = {
-    "AA-BB-CC-DD-EE-02": {
-        "total_power": 250.0,
-        "total_power_used": 45.3,
-        "total_percent_used": 18.1,
-    },
-    "AA-BB-CC-DD-EE-04": {
-        "total_power": 370.0,
-        "total_power_used": 112.7,
-        "total_percent_used": 30.5,
-    },
-}
+        "devices": MappingProxyType({}),
+        "poe_ports": MappingProxyType({}),
+        "poe_budget": _EMPTY_POE_BUDGET,
+        "ssids": (),
+        "ap_ssid_overrides": MappingProxyType({}),
+        "wan_status": MappingProxyType({}),
+        "all_clients": (),
+        "site_id": TEST_SITE_ID,
+        "site_name": TEST_SITE_NAME,
+    }
+)
 
 
 def _build_site_data(
-    all_clients: list[dict[str, Any]] | None = None,
-    poe_budget: dict[str, dict[str, Any]] | None = None,
+    all_clients: Sequence[Mapping[str, Any]] | None = None,
+    poe_budget: Mapping[str, Mapping[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Build coordinator data dict with site-level data."""
     return {
-        "devices": {},
-        "poe_ports": {},
-        "poe_budget": poe_budget or {},
-        "ssids": [],
-        "ap_ssid_overrides": {},
-        "wan_status": {},
-        "all_clients": all_clients or [],
-        "site_id": TEST_SITE_ID,
-        "site_name": TEST_SITE_NAME,
+        **_EMPTY_SITE_DATA,
+        "all_clients": all_clients or (),
+        "poe_budget": poe_budget or _EMPTY_POE_BUDGET,
     }
 
 
 def _create_site_sensor(
-    hass: HomeAssistant,
-    data: dict[str, Any],
+    data: Mapping[str, Any],
     description_key: str,
 ) -> OmadaSiteSensor:
-    """Create an OmadaSiteSensor with a mock coordinator."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    coordinator.data = data
-
-    description = next(d for d in SITE_SENSORS if d.key == description_key)
-
-    return OmadaSiteSensor(
-        coordinator=coordinator,
-        description=description,
+    """Create an OmadaSiteSensor backed by a stub site coordinator."""
+    return create_stub_sensor(
+        OmadaSiteSensor, _SITE_SENSOR_BY_KEY[description_key], data
     )
 
 
 # ---------------------------------------------------------------------------
-# Total clients
+# Client count sensors
 # ---------------------------------------------------------------------------
 
+_ALL_CLIENT_NAMES = frozenset(c["name"] for c in SAMPLE_CLIENTS)
+_WIRED_CLIENT_NAMES = frozenset({"Printer", "Desktop"})
+_WIRELESS_CLIENT_NAMES = frozenset({"Laptop", "Phone", "Tablet"})
+
+_CLIENT_SENSOR_CASES = pytest.mark.parametrize(
+    ("description_key", "expected_names"),
+    [
+        ("site_total_clients", _ALL_CLIENT_NAMES),
+        ("site_wired_clients", _WIRED_CLIENT_NAMES),
+        ("site_wireless_clients", _WIRELESS_CLIENT_NAMES),
+    ],
+    ids=["total", "wired", "wireless"],
+)
 
-async def test_site_total_clients(hass: HomeAssistant) -> None:
-    """Test site total clients returns count of all clients."""
+
+@_CLIENT_SENSOR_CASES
+def test_site_client_count(
+    description_key: str, expected_names: frozenset[str]
+) -> None:
+    """Test site client sensors count the matching clients."""
     data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_total_clients")
-    assert sensor.native_value == 5
+    sensor = _create_site_sensor(data, description_key)
+    assert sensor.native_value == len(expected_names)
 
 
-async def test_site_total_clients_attrs(hass: HomeAssistant) -> None:
-    """Test site total clients has client list attribute."""
+@_CLIENT_SENSOR_CASES
+def test_site_client_list_attrs(
+    description_key: str, expected_names: frozenset[str]
+) -> None:
+    """Test site client sensors list only the matching clients."""
     data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_total_clients")
+    sensor = _create_site_sensor(data, description_key)
     attrs = sensor.extra_state_attributes
     assert attrs is not None
-    assert len(attrs["clients"]) == 5
-    names = {c["name"] for c in attrs["clients"]}
-    assert "Laptop" in names
-    assert "Desktop" in names
+    assert len(attrs["clients"]) == len(expected_names)
+    assert {c["name"] for c in attrs["clients"]} == expected_names
 
 
-async def test_site_total_clients_empty(hass: HomeAssistant) -> None:
+def test_site_total_clients_empty() -> None:
     """Test site total clients returns 0 when no clients."""
     data = _build_site_data(all_clients=[])
-    sensor = _create_site_sensor(hass, data, "site_total_clients")
+    sensor = _create_site_sensor(data, "site_total_clients")
     assert sensor.native_value == 0
 
 
-# ---------------------------------------------------------------------------
-# Wired clients
-# ---------------------------------------------------------------------------
-
-
-async def test_site_wired_clients(hass: HomeAssistant) -> None:
-    """Test site wired clients returns only wired count."""
-    data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_wired_clients")
-    assert sensor.native_value == 2
-
-
-async def test_site_wired_clients_attrs(hass: HomeAssistant) -> None:
-    """Test site wired clients has only wired clients in attribute."""
-    data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_wired_clients")
-    attrs = sensor.extra_state_attributes
-    assert attrs is not None
-    assert len(attrs["clients"]) == 2
-    names = {c["name"] for c in attrs["clients"]}
-    assert names == {"Printer", "Desktop"}
-
-
-# ---------------------------------------------------------------------------
-# Wireless clients
-# ---------------------------------------------------------------------------
-
-
-async def test_site_wireless_clients(hass: HomeAssistant) -> None:
-    """Test site wireless clients returns only wireless count."""
-    data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_wireless_clients")
-    assert sensor.native_value == 3
-
-
-async def test_site_wireless_clients_attrs(hass: HomeAssistant) -> None:
-    """Test site wireless clients has only wireless clients in attribute."""
-    data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_wireless_clients")
-    attrs = sensor.extra_state_attributes
-    assert attrs is not None
-    assert len(attrs["clients"]) == 3
-    names = {c["name"] for c in attrs["clients"]}
-    assert names == {"Laptop", "Phone", "Tablet"}
-
-
 # ---------------------------------------------------------------------------
 # PoE consumption
 # ---------------------------------------------------------------------------
 
+_POE_SITE_DATA = MappingProxyType(_build_site_data(poe_budget=SAMPLE_POE_BUDGET))
 
-async def test_site_poe_consumption(hass: HomeAssistant) -> None:
+
+def test_site_poe_consumption() -> None:
     """Test site PoE consumption sums across all switches."""
-    data = _build_site_data(poe_budget=SAMPLE_POE_BUDGET)
-    sensor = _create_site_sensor(hass, data, "site_poe_consumption")
+    sensor = _create_site_sensor(_POE_SITE_DATA, "site_poe_consumption")
     # 45.3 + 112.7 = 158.0
     assert sensor.native_value == 158.0
 
 
-async def test_site_poe_consumption_no_switches(hass: HomeAssistant) -> None:
+def test_site_poe_consumption_no_switches() -> None:
     """Test site PoE consumption is 0 when no switches."""
-    data = _build_site_data(poe_budget={})
-    sensor = _create_site_sensor(hass, data, "site_poe_consumption")
+    sensor = _create_site_sensor(_EMPTY_SITE_DATA, "site_poe_consumption")
     assert sensor.native_value == 0.0
 
 
-async def test_site_poe_consumption_no_attrs(hass: HomeAssistant) -> None:
+def test_site_poe_consumption_no_attrs() -> None:
     """Test PoE consumption sensor has no client list attribute."""
-    data = _build_site_data(poe_budget=SAMPLE_POE_BUDGET)
-    sensor = _create_site_sensor(hass, data, "site_poe_consumption")
+    sensor = _create_site_sensor(_POE_SITE_DATA, "site_poe_consumption")
     assert sensor.extra_state_attributes is None
 
 
@@ -196,19 +193,19 @@ async def test_site_poe_consumption_no_attrs(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_site_sensor_unique_id(hass: HomeAssistant) -> None:
+def test_site_sensor_unique_id() -> None:
     """Test unique_id format for site sensor."""
     data = _build_site_data()
-    sensor = _create_site_sensor(hass, data, "site_total_clients")
+    sensor = _create_site_sensor(data, "site_total_clients")
     assert sensor.unique_id == f"site_{TEST_SITE_ID}_site_total_clients"
 
 
-async def test_site_sensor_device_info(hass: HomeAssistant) -> None:
+def test_site_sensor_device_info() -> None:
     """Test device_info uses site device identifier."""
     data = _build_site_data()
-    sensor = _create_site_sensor(hass, data, "site_total_clients")
+    sensor = _create_site_sensor(data, "site_total_clients")
     device_info = sensor._attr_device_info  # noqa: SLF001
-    assert (DOMAIN, f"site_{TEST_SITE_ID}") in device_info["identifiers"]
+    assert _SITE_IDENTIFIER in device_info["identifiers"]
 
 
 # ---------------------------------------------------------------------------
@@ -216,18 +213,16 @@ async def test_site_sensor_device_info(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_site_sensor_available(hass: HomeAssistant) -> None:
+def test_site_sensor_available() -> None:
     """Test site sensor available when coordinator succeeds."""
     data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_total_clients")
+    sensor = _create_site_sensor(data, "site_total_clients")
     assert sensor.available is True
 
 
-async def test_site_sensor_unavailable_coordinator_failure(
-    hass: HomeAssistant,
-) -> None:
+def test_site_sensor_unavailable_coordinator_failure() -> None:
     """Test site sensor unavailable when coordinator fails."""
     data = _build_site_data(all_clients=SAMPLE_CLIENTS)
-    sensor = _create_site_sensor(hass, data, "site_total_clients")
+    sensor = _create_site_sensor(data, "site_total_clients")
     sensor.coordinator.last_update_success = False
     assert sensor.available is False
@@ -2,54 +2,36 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from types import MappingProxyType
 
-if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+import pytest
 
 from custom_components.omada_open_api.const import DOMAIN
-from custom_components.omada_open_api.coordinator import (
-    OmadaDeviceStatsCoordinator,
-    OmadaSiteCoordinator,
-)
 from custom_components.omada_open_api.sensor import (
     DEVICE_TRAFFIC_SENSORS,
     OmadaDeviceTrafficSensor,
 )
 
-from .conftest import TEST_SITE_ID, TEST_SITE_NAME
+from .conftest import create_stub_sensor
 
 AP_MAC = "AA-BB-CC-DD-EE-01"
 SWITCH_MAC = "AA-BB-CC-DD-EE-02"
 GATEWAY_MAC = "AA-BB-CC-DD-EE-03"
+_SWITCH_IDENTIFIER = (DOMAIN, SWITCH_MAC)
+
+_TRAFFIC_SENSOR_BY_KEY = MappingProxyType({d.key: d for d in DEVICE_TRAFFIC_SENSORS})
 
 
 def _create_device_traffic_sensor(
-    hass: HomeAssistant,
     stats: dict[str, dict],
     description_key: str,
     device_mac: str = AP_MAC,
 ) -> OmadaDeviceTrafficSensor:
-    """Create an OmadaDeviceTrafficSensor with mock coordinator."""
-    site_coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    coordinator = OmadaDeviceStatsCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_coordinator=site_coordinator,
-    )
-    coordinator.data = stats
-
-    description = next(d for d in DEVICE_TRAFFIC_SENSORS if d.key == description_key)
-
-    return OmadaDeviceTrafficSensor(
-        coordinator=coordinator,
-        description=description,
+    """Create an OmadaDeviceTrafficSensor backed by a stub stats coordinator."""
+    return create_stub_sensor(
+        OmadaDeviceTrafficSensor,
+        _TRAFFIC_SENSOR_BY_KEY[description_key],
+        stats,
         device_mac=device_mac,
     )
 
@@ -59,61 +41,31 @@ def _create_device_traffic_sensor(
 # ---------------------------------------------------------------------------
 
 
-async def test_daily_download(hass: HomeAssistant) -> None:
-    """Test daily download sensor returns daily_rx bytes."""
-    sensor = _create_device_traffic_sensor(
-        hass,
-        {AP_MAC: {"daily_rx": 1_200_000_000, "daily_tx": 500_000_000}},
-        "daily_download",
-    )
-    assert sensor.native_value == 1_200.0
-
-
-async def test_daily_upload(hass: HomeAssistant) -> None:
-    """Test daily upload sensor returns daily_tx in MB."""
-    sensor = _create_device_traffic_sensor(
-        hass,
-        {AP_MAC: {"daily_rx": 1_200_000_000, "daily_tx": 500_000_000}},
-        "daily_upload",
-    )
-    assert sensor.native_value == 500.0
-
-
-async def test_daily_download_zero(hass: HomeAssistant) -> None:
-    """Test daily download returns 0 when no traffic."""
-    sensor = _create_device_traffic_sensor(
-        hass,
-        {AP_MAC: {"daily_rx": 0, "daily_tx": 0}},
-        "daily_download",
-    )
-    assert sensor.native_value == 0.0
-
-
-# ---------------------------------------------------------------------------
-# Different device types
-# ---------------------------------------------------------------------------
-
-
-async def test_daily_download_switch(hass: HomeAssistant) -> None:
-    """Test daily download for a switch device."""
-    sensor = _create_device_traffic_sensor(
-        hass,
-        {SWITCH_MAC: {"daily_rx": 5_000_000_000, "daily_tx": 2_000_000_000}},
-        "daily_download",
-        device_mac=SWITCH_MAC,
-    )
-    assert sensor.native_value == 5_000.0
-
-
-async def test_daily_upload_gateway(hass: HomeAssistant) -> None:
-    """Test daily upload for a gateway device."""
+@pytest.mark.parametrize(
+    ("device_mac", "daily_rx", "daily_tx", "description_key", "expected"),
+    [
+        (AP_MAC, 1_200_000_000, 500_000_000, "daily_download", 1_200.0),
+        (AP_MAC, 1_200_000_000, 500_000_000, "daily_upload", 500.0),
+        (AP_MAC, 0, 0, "daily_download", 0.0),
+        (SWITCH_MAC, 5_000_000_000, 2_000_000_000, "daily_download", 5_000.0),
+        (GATEWAY_MAC, 10_000_000_000, 8_000_000_000, "daily_upload", 8_000.0),
+    ],
+    ids=["ap_download", "ap_upload", "ap_zero", "switch_download", "gateway_upload"],
+)
+def test_daily_traffic_native_value(
+    device_mac: str,
+    daily_rx: int,
+    daily_tx: int,
+    description_key: str,
+    expected: float,
+) -> None:
+    """Test daily download/upload sensors convert bytes to MB per device."""
     sensor = _create_device_traffic_sensor(
-        hass,
-        {GATEWAY_MAC: {"daily_rx": 10_000_000_000, "daily_tx": 8_000_000_000}},
-        "daily_upload",
-        device_mac=GATEWAY_MAC,
+        {device_mac: {"daily_rx": daily_rx, "daily_tx": daily_tx}},
+        description_key,
+        device_mac=device_mac,
     )
-    assert sensor.native_value == 8_000.0
+    assert sensor.native_value == expected
 
 
 # ---------------------------------------------------------------------------
@@ -121,26 +73,24 @@ async def test_daily_upload_gateway(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_unique_id_format(hass: HomeAssistant) -> None:
+def test_unique_id_format() -> None:
     """Test unique_id format for device traffic sensor."""
     sensor = _create_device_traffic_sensor(
-        hass,
         {AP_MAC: {"daily_rx": 0, "daily_tx": 0}},
         "daily_download",
     )
     assert sensor.unique_id == f"{AP_MAC}_daily_download"
 
 
-async def test_device_info(hass: HomeAssistant) -> None:
+def test_device_info() -> None:
     """Test device_info links sensor to the infrastructure device."""
     sensor = _create_device_traffic_sensor(
-        hass,
         {SWITCH_MAC: {"daily_rx": 0, "daily_tx": 0}},
         "daily_upload",
         device_mac=SWITCH_MAC,
     )
     device_info = sensor._attr_device_info  # noqa: SLF001
-    assert (DOMAIN, SWITCH_MAC) in device_info["identifiers"]
+    assert _SWITCH_IDENTIFIER in device_info["identifiers"]
 
 
 # ---------------------------------------------------------------------------
@@ -148,50 +98,45 @@ async def test_device_info(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_available_with_data(hass: HomeAssistant) -> None:
+def test_available_with_data() -> None:
     """Test sensor is available when device data exists."""
     sensor = _create_device_traffic_sensor(
-        hass,
         {AP_MAC: {"daily_rx": 100, "daily_tx": 50}},
         "daily_download",
     )
     assert sensor.available is True
 
 
-async def test_unavailable_no_device(hass: HomeAssistant) -> None:
+def test_unavailable_no_device() -> None:
     """Test sensor unavailable when device not in stats data."""
     sensor = _create_device_traffic_sensor(
-        hass,
         {},  # Empty stats
         "daily_download",
     )
     assert sensor.available is False
 
 
-async def test_native_value_none_no_device(hass: HomeAssistant) -> None:
+def test_native_value_none_no_device() -> None:
     """Test native_value is None when device not in data."""
     sensor = _create_device_traffic_sensor(
-        hass,
         {},
         "daily_upload",
     )
     assert sensor.native_value is None
 
 
-async def test_unavailable_missing_field(hass: HomeAssistant) -> None:
+def test_unavailable_missing_field() -> None:
     """Test sensor unavailable when daily_rx field is None."""
     sensor = _create_device_traffic_sensor(
-        hass,
         {AP_MAC: {"daily_tx": 100}},  # Missing daily_rx
         "daily_download",
     )
     assert sensor.available is False
 
 
-async def test_unavailable_coordinator_failure(hass: HomeAssistant) -> None:
+def test_unavailable_coordinator_failure() -> None:
     """Test sensor unavailable when coordinator last_update_success is False."""
     sensor = _create_device_traffic_sensor(
-        hass,
         {AP_MAC: {"daily_rx": 100, "daily_tx": 50}},
         "daily_download",
     )
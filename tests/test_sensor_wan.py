@@ -2,61 +2,73 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Mapping, Sequence
 
-from custom_components.omada_open_api.const import DOMAIN, WAN_SPEED_MAP
-from custom_components.omada_open_api.coordinator import OmadaSiteCoordinator
+from custom_components.omada_open_api.const import DOMAIN
 from custom_components.omada_open_api.sensor import (
     WAN_PORT_SENSORS,
     OmadaWanSensor,
     _build_wan_sensors,
 )
 
-from .conftest import SAMPLE_WAN_PORT_1, SAMPLE_WAN_PORT_2, TEST_SITE_ID, TEST_SITE_NAME
+from .conftest import (
+    SAMPLE_WAN_PORT_1,
+    SAMPLE_WAN_PORT_2,
+    TEST_SITE_ID,
+    TEST_SITE_NAME,
+    create_stub_coordinator,
+    create_stub_sensor,
+)
 
 GATEWAY_MAC = "AA-BB-CC-DD-EE-03"
+_GATEWAY_IDENTIFIER = (DOMAIN, GATEWAY_MAC)
 
+_WAN_SENSOR_BY_KEY = MappingProxyType({d.key: d for d in WAN_PORT_SENSORS})
 
-def _build_coordinator_data(
-    wan_status: dict[str, list[dict]] | None = None,
-) -> dict:
-    """Build coordinator data dict with WAN status."""
-    return {
-        "devices": {},
-        "poe_ports": {},
-        "poe_budget": {},
+# Read-only WAN status snapshots shared by every test in this module.
+_WAN1 = MappingProxyType({GATEWAY_MAC: (SAMPLE_WAN_PORT_1,)})
+_WAN2 = MappingProxyType({GATEWAY_MAC: (SAMPLE_WAN_PORT_2,)})
+_WAN_BOTH = MappingProxyType({GATEWAY_MAC: (SAMPLE_WAN_PORT_1, SAMPLE_WAN_PORT_2)})
+
+_EMPTY_COORDINATOR_DATA = MappingProxyType(
+    {
+        "devices": MappingProxyType({}),
+        "poe_ports": MappingProxyType({}),
+        "poe_budget": MappingProxyType({}),
         "site_id": TEST_SITE_ID,
         "site_name": TEST_SITE_NAME,
-        "wan_status": wan_status or {},
+        "wan_status": MappingProxyType({}),
     }
+)
+
+
+def _build_coordinator_data(
+    wan_status: Mapping[str, Sequence[Mapping[str, Any]]] | None = None,
+) -> dict:
+    """Build coordinator data dict with WAN status."""
+    if not wan_status:
+        return dict(_EMPTY_COORDINATOR_DATA)
+    return {**_EMPTY_COORDINATOR_DATA, "wan_status": wan_status}
 
 
 def _create_wan_sensor(
-    hass: HomeAssistant,
-    wan_status: dict[str, list[dict]],
+    wan_status: Mapping[str, Sequence[Mapping[str, Any]]],
     description_key: str,
     gateway_mac: str = GATEWAY_MAC,
     port_index: int = 0,
     port_name: str = "WAN1",
 ) -> OmadaWanSensor:
-    """Create an OmadaWanSensor with a mock coordinator."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    coordinator.data = _build_coordinator_data(wan_status)
-
-    description = next(d for d in WAN_PORT_SENSORS if d.key == description_key)
-
-    return OmadaWanSensor(
-        coordinator=coordinator,
-        description=description,
+    """Create an OmadaWanSensor backed by a stub site coordinator."""
+    return create_stub_sensor(
+        OmadaWanSensor,
+        _WAN_SENSOR_BY_KEY[description_key],
+        _build_coordinator_data(wan_status),
         gateway_mac=gateway_mac,
         port_index=port_index,
         port_name=port_name,
@@ -64,171 +76,91 @@ def _create_wan_sensor(
 
 
 # ---------------------------------------------------------------------------
-# WAN download / upload rate sensors
+# WAN native values
 # ---------------------------------------------------------------------------
 
 
-async def test_wan_download_rate(hass: HomeAssistant) -> None:
-    """Test WAN download rate sensor returns rxRate."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_download_rate",
-    )
-    assert sensor.native_value == 1250.5
-
-
-async def test_wan_upload_rate(hass: HomeAssistant) -> None:
-    """Test WAN upload rate sensor returns txRate."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_upload_rate",
-    )
-    assert sensor.native_value == 340.2
-
-
-async def test_wan_download_rate_disconnected(hass: HomeAssistant) -> None:
-    """Test WAN download rate on disconnected port."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_2]},
-        "wan_download_rate",
-    )
-    assert sensor.native_value == 0
-
-
-# ---------------------------------------------------------------------------
-# WAN download / upload total sensors
-# ---------------------------------------------------------------------------
-
-
-async def test_wan_download_total(hass: HomeAssistant) -> None:
-    """Test WAN download total sensor returns rx bytes."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_download_total",
-    )
-    assert sensor.native_value == 15_000.0
-
-
-async def test_wan_upload_total(hass: HomeAssistant) -> None:
-    """Test WAN upload total sensor returns tx in MB."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_upload_total",
-    )
-    assert sensor.native_value == 3_000.0
-
-
-# ---------------------------------------------------------------------------
-# WAN latency and packet loss
-# ---------------------------------------------------------------------------
-
-
-async def test_wan_latency(hass: HomeAssistant) -> None:
-    """Test WAN latency sensor returns latency in ms."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_latency",
-    )
-    assert sensor.native_value == 12
-
-
-async def test_wan_latency_disconnected_unavailable(hass: HomeAssistant) -> None:
-    """Test WAN latency sensor unavailable when port is disconnected."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_2]},
-        "wan_latency",
-    )
-    assert sensor.available is False
-
-
-async def test_wan_packet_loss(hass: HomeAssistant) -> None:
-    """Test WAN packet loss sensor returns loss percentage."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_packet_loss",
-    )
-    assert sensor.native_value == 0.1
-
-
-async def test_wan_packet_loss_disconnected_unavailable(
-    hass: HomeAssistant,
+@pytest.mark.parametrize(
+    ("description_key", "wan_status", "expected"),
+    [
+        ("wan_download_rate", _WAN1, 1250.5),
+        ("wan_upload_rate", _WAN1, 340.2),
+        ("wan_download_rate", _WAN2, 0),
+        ("wan_download_total", _WAN1, 15_000.0),
+        ("wan_upload_total", _WAN1, 3_000.0),
+        ("wan_latency", _WAN1, 12),
+        ("wan_packet_loss", _WAN1, 0.1),
+        ("wan_ip_address", _WAN1, "203.0.113.10"),
+        # speed=3 -> 1000 Mbps, speed=2 -> 100 Mbps via WAN_SPEED_MAP
+        ("wan_link_speed", _WAN1, 1000),
+        ("wan_link_speed", _WAN2, 100),
+    ],
+    ids=[
+        "download_rate",
+        "upload_rate",
+        "download_rate_disconnected",
+        "download_total",
+        "upload_total",
+        "latency",
+        "packet_loss",
+        "ip_address",
+        "link_speed_1000",
+        "link_speed_100",
+    ],
+)
+def test_wan_native_value(
+    description_key: str,
+    wan_status: Mapping[str, Sequence[Mapping[str, Any]]],
+    expected: float | str,
 ) -> None:
-    """Test WAN packet loss unavailable when port disconnected."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_2]},
-        "wan_packet_loss",
-    )
-    assert sensor.available is False
+    """Test WAN sensor native values for connected and disconnected ports."""
+    sensor = _create_wan_sensor(wan_status, description_key)
+    assert sensor.native_value == expected
 
 
 # ---------------------------------------------------------------------------
-# WAN IP address and link speed
+# Unavailable port data
 # ---------------------------------------------------------------------------
 
 
-async def test_wan_ip_address(hass: HomeAssistant) -> None:
-    """Test WAN IP address sensor returns the IP."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_ip_address",
-    )
-    assert sensor.native_value == "203.0.113.10"
-
-
-async def test_wan_ip_address_empty_unavailable(hass: HomeAssistant) -> None:
-    """Test WAN IP address unavailable when IP is empty."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_2]},
-        "wan_ip_address",
-    )
+@pytest.mark.parametrize(
+    ("wan_status", "description_key", "port_index"),
+    [
+        (_WAN2, "wan_latency", 0),
+        (_WAN2, "wan_packet_loss", 0),
+        (_WAN2, "wan_ip_address", 0),
+        (_WAN2, "wan_ipv6_address", 0),
+        (MappingProxyType({}), "wan_download_rate", 0),
+        (_WAN1, "wan_download_rate", 5),
+    ],
+    ids=[
+        "latency_disconnected",
+        "packet_loss_disconnected",
+        "ip_address_empty",
+        "ipv6_disabled",
+        "no_gateway",
+        "port_index_out_of_range",
+    ],
+)
+def test_wan_sensor_unavailable(
+    wan_status: Mapping[str, Sequence[Mapping[str, Any]]],
+    description_key: str,
+    port_index: int,
+) -> None:
+    """Test WAN sensors are unavailable when their port data is unusable."""
+    sensor = _create_wan_sensor(wan_status, description_key, port_index=port_index)
     assert sensor.available is False
 
 
-async def test_wan_link_speed(hass: HomeAssistant) -> None:
-    """Test WAN link speed returns mapped Mbps value."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_link_speed",
-    )
-    # speed=3 → 1000 Mbps via WAN_SPEED_MAP
-    assert sensor.native_value == WAN_SPEED_MAP[3]
-    assert sensor.native_value == 1000
-
-
-async def test_wan_link_speed_100mbps(hass: HomeAssistant) -> None:
-    """Test WAN link speed for 100 Mbps port."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_2]},
-        "wan_link_speed",
-    )
-    # speed=2 → 100 Mbps
-    assert sensor.native_value == WAN_SPEED_MAP[2]
-    assert sensor.native_value == 100
-
-
 # ---------------------------------------------------------------------------
 # Multiple WAN ports (port_index)
 # ---------------------------------------------------------------------------
 
 
-async def test_second_wan_port(hass: HomeAssistant) -> None:
+def test_second_wan_port() -> None:
     """Test sensor for the second WAN port (port_index=1)."""
     sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1, SAMPLE_WAN_PORT_2]},
+        _WAN_BOTH,
         "wan_download_rate",
         port_index=1,
         port_name="WAN2",
@@ -241,22 +173,20 @@ async def test_second_wan_port(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_unique_id_format(hass: HomeAssistant) -> None:
+def test_unique_id_format() -> None:
     """Test unique_id includes gateway MAC, port index, and key."""
     sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
+        _WAN1,
         "wan_download_rate",
         port_index=0,
     )
     assert sensor.unique_id == f"{GATEWAY_MAC}_wan0_wan_download_rate"
 
 
-async def test_unique_id_second_port(hass: HomeAssistant) -> None:
+def test_unique_id_second_port() -> None:
     """Test unique_id for second WAN port."""
     sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1, SAMPLE_WAN_PORT_2]},
+        _WAN_BOTH,
         "wan_upload_rate",
         port_index=1,
         port_name="WAN2",
@@ -264,22 +194,20 @@ async def test_unique_id_second_port(hass: HomeAssistant) -> None:
     assert sensor.unique_id == f"{GATEWAY_MAC}_wan1_wan_upload_rate"
 
 
-async def test_device_info_links_to_gateway(hass: HomeAssistant) -> None:
+def test_device_info_links_to_gateway() -> None:
     """Test device_info links sensor to the gateway device."""
     sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
+        _WAN1,
         "wan_download_rate",
     )
     device_info = sensor._attr_device_info  # noqa: SLF001
-    assert (DOMAIN, GATEWAY_MAC) in device_info["identifiers"]
+    assert _GATEWAY_IDENTIFIER in device_info["identifiers"]
 
 
-async def test_translation_placeholders(hass: HomeAssistant) -> None:
+def test_translation_placeholders() -> None:
     """Test translation placeholders contain port_name."""
     sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
+        _WAN1,
         "wan_latency",
         port_name="WAN1",
     )
@@ -292,46 +220,19 @@ async def test_translation_placeholders(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_wan_sensor_unavailable_no_gateway(hass: HomeAssistant) -> None:
-    """Test sensor unavailable when gateway not in WAN status data."""
-    sensor = _create_wan_sensor(
-        hass,
-        {},  # Empty WAN status
-        "wan_download_rate",
-    )
-    assert sensor.available is False
-
-
-async def test_wan_sensor_unavailable_port_index_out_of_range(
-    hass: HomeAssistant,
-) -> None:
-    """Test sensor unavailable when port_index exceeds port list."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
-        "wan_download_rate",
-        port_index=5,
-    )
-    assert sensor.available is False
-
-
-async def test_wan_sensor_none_when_no_port_data(hass: HomeAssistant) -> None:
+def test_wan_sensor_none_when_no_port_data() -> None:
     """Test native_value is None when port data missing."""
     sensor = _create_wan_sensor(
-        hass,
         {},
         "wan_download_rate",
     )
     assert sensor.native_value is None
 
 
-async def test_wan_sensor_unavailable_coordinator_failure(
-    hass: HomeAssistant,
-) -> None:
+def test_wan_sensor_unavailable_coordinator_failure() -> None:
     """Test sensor unavailable when coordinator last_update_success is False."""
     sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
+        _WAN1,
         "wan_download_rate",
     )
     sensor.coordinator.last_update_success = False
@@ -342,71 +243,44 @@ async def test_wan_sensor_unavailable_coordinator_failure(
 # _build_wan_sensors helper
 # ---------------------------------------------------------------------------
 
-
-async def test_build_wan_sensors_creates_all_descriptions(
-    hass: HomeAssistant,
-) -> None:
-    """Test _build_wan_sensors creates a sensor for each description per port."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    wan_status = {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]}
-    known: set[str] = set()
-
-    entities = _build_wan_sensors(coordinator, wan_status, known)
-    assert len(entities) == len(WAN_PORT_SENSORS)
-    assert f"{GATEWAY_MAC}_wan_0" in known
-
-
-async def test_build_wan_sensors_skips_already_known(
-    hass: HomeAssistant,
-) -> None:
-    """Test _build_wan_sensors skips already-known WAN port keys."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    wan_status = {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]}
-    known: set[str] = {f"{GATEWAY_MAC}_wan_0"}
-
-    entities = _build_wan_sensors(coordinator, wan_status, known)
-    assert entities == []
-
-
-async def test_build_wan_sensors_multiple_ports(
-    hass: HomeAssistant,
+_WAN0_KEY = f"{GATEWAY_MAC}_wan_0"
+_WAN1_KEY = f"{GATEWAY_MAC}_wan_1"
+
+
+@pytest.fixture(scope="module")
+def wan_coordinator() -> SimpleNamespace:
+    """Return one stub site coordinator shared by the _build_wan_sensors tests."""
+    return create_stub_coordinator(_build_coordinator_data())
+
+
+@pytest.mark.parametrize(
+    ("wan_status", "known_before", "expected_count", "known_after"),
+    [
+        (_WAN1, frozenset(), len(WAN_PORT_SENSORS), {_WAN0_KEY}),
+        (_WAN1, frozenset({_WAN0_KEY}), 0, {_WAN0_KEY}),
+        (
+            _WAN_BOTH,
+            frozenset(),
+            len(WAN_PORT_SENSORS) * 2,
+            {_WAN0_KEY, _WAN1_KEY},
+        ),
+        (MappingProxyType({}), frozenset(), 0, set()),
+    ],
+    ids=["single_port", "already_known", "multiple_ports", "empty"],
+)
+def test_build_wan_sensors(
+    wan_coordinator: SimpleNamespace,
+    wan_status: Mapping[str, Sequence[Mapping[str, Any]]],
+    known_before: frozenset[str],
+    expected_count: int,
+    known_after: set[str],
 ) -> None:
-    """Test _build_wan_sensors handles multiple WAN ports."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    wan_status = {GATEWAY_MAC: [SAMPLE_WAN_PORT_1, SAMPLE_WAN_PORT_2]}
-    known: set[str] = set()
-
-    entities = _build_wan_sensors(coordinator, wan_status, known)
-    assert len(entities) == len(WAN_PORT_SENSORS) * 2
+    """Test _build_wan_sensors creates sensors only for new WAN ports."""
+    known = set(known_before)
 
-
-async def test_build_wan_sensors_empty_wan_status(
-    hass: HomeAssistant,
-) -> None:
-    """Test _build_wan_sensors returns empty list for empty wan_status."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-    )
-    entities = _build_wan_sensors(coordinator, {}, set())
-    assert entities == []
+    entities = _build_wan_sensors(wan_coordinator, wan_status, known)
+    assert len(entities) == expected_count
+    assert known == known_after
 
 
 # ---------------------------------------------------------------------------
@@ -414,28 +288,17 @@ async def test_build_wan_sensors_empty_wan_status(
 # ---------------------------------------------------------------------------
 
 
-async def test_wan_ipv6_address(hass: HomeAssistant) -> None:
+def test_wan_ipv6_address() -> None:
     """Test WAN IPv6 address sensor returns the IPv6 addr."""
     sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_1]},
+        _WAN1,
         "wan_ipv6_address",
     )
     assert sensor.native_value == "2001:db8::1"
     assert sensor.available is True
 
 
-async def test_wan_ipv6_address_disabled_unavailable(hass: HomeAssistant) -> None:
-    """Test WAN IPv6 address unavailable when IPv6 is disabled."""
-    sensor = _create_wan_sensor(
-        hass,
-        {GATEWAY_MAC: [SAMPLE_WAN_PORT_2]},
-        "wan_ipv6_address",
-    )
-    assert sensor.available is False
-
-
-async def test_wan_ipv6_address_no_config(hass: HomeAssistant) -> None:
+def test_wan_ipv6_address_no_config() -> None:
     """Test WAN IPv6 address unavailable when wanPortIpv6Config is absent."""
     port_no_ipv6 = {
         "portName": "WAN1",
@@ -452,7 +315,6 @@ async def test_wan_ipv6_address_no_config(hass: HomeAssistant) -> None:
         "speed": 3,
     }
     sensor = _create_wan_sensor(
-        hass,
         {GATEWAY_MAC: [port_no_ipv6]},
         "wan_ipv6_address",
     )
@@ -2,23 +2,23 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType, SimpleNamespace
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from homeassistant.core import HomeAssistant
 
 from homeassistant.exceptions import HomeAssistantError
 
-from custom_components.omada_open_api.api import OmadaApiError
+from custom_components.omada_open_api.api import OmadaApiClient, OmadaApiError
 from custom_components.omada_open_api.clients import process_client
 from custom_components.omada_open_api.const import DOMAIN
-from custom_components.omada_open_api.coordinator import (
-    OmadaClientCoordinator,
-    OmadaSiteCoordinator,
-)
+from custom_components.omada_open_api.coordinator import OmadaSiteCoordinator
 from custom_components.omada_open_api.switch import (
     OmadaClientBlockSwitch,
     OmadaLedSwitch,
@@ -26,41 +26,70 @@ from custom_components.omada_open_api.switch import (
     async_setup_entry,
 )
 
-from .conftest import SAMPLE_CLIENT_WIRELESS, TEST_SITE_ID, TEST_SITE_NAME
+from .conftest import (
+    SAMPLE_CLIENT_WIRELESS,
+    TEST_SITE_ID,
+    TEST_SITE_NAME,
+    create_stub_coordinator,
+)
 
 # ---------------------------------------------------------------------------
 # Sample data
 # ---------------------------------------------------------------------------
 
-SAMPLE_PORT_ENABLED = {
-    "switch_mac": "AA-BB-CC-DD-EE-02",
-    "switch_name": "Core Switch",
-    "port": 1,
-    "port_name": "Port 1",
-    "poe_enabled": True,
-    "power": 12.5,
-    "voltage": 53.2,
-    "current": 235.0,
-    "poe_status": 1.0,
-    "pd_class": "Class 4",
-    "poe_display_type": 4,
-    "connected_status": 0,
-}
-
-SAMPLE_PORT_DISABLED = {
-    "switch_mac": "AA-BB-CC-DD-EE-02",
-    "switch_name": "Core Switch",
-    "port": 2,
-    "port_name": "Port 2",
-    "poe_enabled": False,
-    "power": 0.0,
-    "voltage": 0.0,
-    "current": 0.0,
-    "poe_status": 0.0,
-    "pd_class": "",
-    "poe_display_type": 4,
-    "connected_status": 1,
-}
+# Read-only; tests that change a port's data pass a copy.
+SAMPLE_PORT_ENABLED = MappingProxyType(
+    {
+        "switch_mac": "AA-BB-CC-DD-EE-02",
+        "switch_name": "Core Switch",
+        "port": 1,
+        "port_name": "Port 1",
+        "poe_enabled": True,
+        "power": 12.5,
+        "voltage": 53.2,
+        "current": 235.0,
+        "poe_status": 1.0,
+        "pd_class": "Class 4",
+        "poe_display_type": 4,
+        "connected_status": 0,
+    }
+)
+
+SAMPLE_PORT_DISABLED = MappingProxyType(
+    {
+        "switch_mac": "AA-BB-CC-DD-EE-02",
+        "switch_name": "Core Switch",
+        "port": 2,
+        "port_name": "Port 2",
+        "poe_enabled": False,
+        "power": 0.0,
+        "voltage": 0.0,
+        "current": 0.0,
+        "poe_status": 0.0,
+        "pd_class": "",
+        "poe_display_type": 4,
+        "connected_status": 1,
+    }
+)
+
+# Raised through side_effect only; the tests never inspect them afterwards.
+_ERR_PROFILE = OmadaApiError("Profile override failed")
+_ERR_POE_MODE = OmadaApiError("PoE mode failed")
+_ERR_PERM_1007 = OmadaApiError("No permission", error_code=-1007)
+_ERR_PERM_1005 = OmadaApiError("Access denied", error_code=-1005)
+_ERR_FAIL = OmadaApiError("fail")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_state_writes() -> Generator[None]:
+    """Make async_write_ha_state a no-op for the switches under test.
+
+    The entities are never added to hass, so a real state write would fail.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for switch_cls in (OmadaPoeSwitch, OmadaLedSwitch):
+            mp.setattr(switch_cls, "async_write_ha_state", lambda self: None)
+        yield
 
 
 def _build_coordinator_data(
@@ -76,24 +105,13 @@ def _build_coordinator_data(
     }
 
 
-def _create_switch(
-    hass: HomeAssistant,
-    port_key: str,
-    poe_ports: dict,
-) -> OmadaPoeSwitch:
-    """Create an OmadaPoeSwitch with a mock coordinator."""
-    api_client = MagicMock()
-    api_client.set_port_profile_override = AsyncMock()
-    api_client.set_port_poe_mode = AsyncMock()
-
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=api_client,
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
+def _create_switch(port_key: str, poe_ports: dict) -> OmadaPoeSwitch:
+    """Create an OmadaPoeSwitch backed by a stub site coordinator."""
+    coordinator = create_stub_coordinator(
+        _build_coordinator_data(poe_ports),
+        MagicMock(spec=OmadaApiClient),
+        async_request_refresh=AsyncMock(),
     )
-    coordinator.data = _build_coordinator_data(poe_ports)
-
     return OmadaPoeSwitch(coordinator=coordinator, port_key=port_key)
 
 
@@ -102,27 +120,27 @@ def _create_switch(
 # ---------------------------------------------------------------------------
 
 
-def test_unique_id(hass: HomeAssistant) -> None:
+def test_unique_id() -> None:
     """Test unique ID format."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
     assert switch.unique_id == "AA-BB-CC-DD-EE-02_port1_poe"
 
 
-def test_name(hass: HomeAssistant) -> None:
+def test_name() -> None:
     """Test entity name."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
     assert switch.translation_key == "poe"
     assert switch.translation_placeholders == {"port_name": "Port 1"}
 
 
-def test_device_info(hass: HomeAssistant) -> None:
+def test_device_info() -> None:
     """Test device info links to parent switch."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
     assert switch.device_info == {"identifiers": {(DOMAIN, "AA-BB-CC-DD-EE-02")}}
 
@@ -132,26 +150,27 @@ def test_device_info(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_is_on_enabled(hass: HomeAssistant) -> None:
-    """Test is_on when PoE is enabled."""
-    switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
-    )
-    assert switch.is_on is True
-
-
-def test_is_on_disabled(hass: HomeAssistant) -> None:
-    """Test is_on when PoE is disabled."""
-    switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_2", {"AA-BB-CC-DD-EE-02_2": SAMPLE_PORT_DISABLED}
-    )
-    assert switch.is_on is False
-
-
-def test_is_on_missing_port(hass: HomeAssistant) -> None:
-    """Test is_on when port data is missing."""
-    switch = _create_switch(hass, "AA-BB-CC-DD-EE-02_1", {})
-    assert switch.is_on is None
+@pytest.mark.parametrize(
+    ("port_key", "poe_ports", "expected"),
+    [
+        (
+            "AA-BB-CC-DD-EE-02_1",
+            {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED},
+            True,
+        ),
+        (
+            "AA-BB-CC-DD-EE-02_2",
+            {"AA-BB-CC-DD-EE-02_2": SAMPLE_PORT_DISABLED},
+            False,
+        ),
+        ("AA-BB-CC-DD-EE-02_1", {}, None),
+    ],
+    ids=["enabled", "disabled", "missing_port"],
+)
+def test_is_on(port_key: str, poe_ports: dict, expected: bool | None) -> None:
+    """Test is_on follows the port's PoE state, or None when it is missing."""
+    switch = _create_switch(port_key, poe_ports)
+    assert switch.is_on is expected
 
 
 # ---------------------------------------------------------------------------
@@ -159,23 +178,27 @@ def test_is_on_missing_port(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_extra_state_attributes(hass: HomeAssistant) -> None:
-    """Test extra state attributes with port data."""
-    switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
-    )
-    attrs = switch.extra_state_attributes
-    assert attrs["port"] == 1
-    assert attrs["port_name"] == "Port 1"
-    assert attrs["power"] == 12.5
-    assert attrs["voltage"] == 53.2
-    assert attrs["current"] == 235.0
-
-
-def test_extra_state_attributes_missing_port(hass: HomeAssistant) -> None:
-    """Test extra state attributes when port data is missing."""
-    switch = _create_switch(hass, "AA-BB-CC-DD-EE-02_1", {})
-    assert switch.extra_state_attributes == {}
+@pytest.mark.parametrize(
+    ("poe_ports", "expected"),
+    [
+        (
+            {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED},
+            {
+                "port": 1,
+                "port_name": "Port 1",
+                "power": 12.5,
+                "voltage": 53.2,
+                "current": 235.0,
+            },
+        ),
+        ({}, {}),
+    ],
+    ids=["with_data", "missing_port"],
+)
+def test_extra_state_attributes(poe_ports: dict, expected: dict) -> None:
+    """Test extra state attributes, which are empty when the port is missing."""
+    switch = _create_switch("AA-BB-CC-DD-EE-02_1", poe_ports)
+    assert switch.extra_state_attributes == expected
 
 
 # ---------------------------------------------------------------------------
@@ -183,30 +206,20 @@ def test_extra_state_attributes_missing_port(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_available_with_data(hass: HomeAssistant) -> None:
-    """Test entity is available when port data exists."""
-    switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
-    )
-    # Simulate successful update.
-    switch.coordinator.last_update_success = True
-    assert switch.available is True
-
-
-def test_unavailable_missing_port(hass: HomeAssistant) -> None:
-    """Test entity is unavailable when port data is missing."""
-    switch = _create_switch(hass, "AA-BB-CC-DD-EE-02_1", {})
-    switch.coordinator.last_update_success = True
-    assert switch.available is False
-
-
-def test_unavailable_coordinator_failure(hass: HomeAssistant) -> None:
-    """Test entity is unavailable when coordinator fails."""
-    switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
-    )
-    switch.coordinator.last_update_success = False
-    assert switch.available is False
+@pytest.mark.parametrize(
+    ("poe_ports", "last_update_success", "expected"),
+    [
+        ({"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}, True, True),
+        ({}, True, False),
+        ({"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}, False, False),
+    ],
+    ids=["with_data", "missing_port", "coordinator_failure"],
+)
+def test_available(poe_ports: dict, last_update_success: bool, expected: bool) -> None:
+    """Test availability needs a successful update and the port's data."""
+    switch = _create_switch("AA-BB-CC-DD-EE-02_1", poe_ports)
+    switch.coordinator.last_update_success = last_update_success
+    assert switch.available is expected
 
 
 # ---------------------------------------------------------------------------
@@ -214,16 +227,14 @@ def test_unavailable_coordinator_failure(hass: HomeAssistant) -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_turn_on(hass: HomeAssistant) -> None:
+async def test_turn_on() -> None:
     """Test turning PoE on enables profile override and sets PoE mode."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
     api = switch.coordinator.api_client
 
-    with patch.object(switch.coordinator, "async_request_refresh", new=AsyncMock()):
-        await switch.async_turn_on()
+    await switch.async_turn_on()
 
     api.set_port_profile_override.assert_awaited_once_with(
         TEST_SITE_ID, "AA-BB-CC-DD-EE-02", 1, enable=True
@@ -233,16 +244,14 @@ async def test_turn_on(hass: HomeAssistant) -> None:
     )
 
 
-@pytest.mark.asyncio
-async def test_turn_off(hass: HomeAssistant) -> None:
+async def test_turn_off() -> None:
     """Test turning PoE off enables profile override and disables PoE mode."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
     api = switch.coordinator.api_client
 
-    with patch.object(switch.coordinator, "async_request_refresh", new=AsyncMock()):
-        await switch.async_turn_off()
+    await switch.async_turn_off()
 
     api.set_port_profile_override.assert_awaited_once_with(
         TEST_SITE_ID, "AA-BB-CC-DD-EE-02", 1, enable=True
@@ -252,106 +261,126 @@ async def test_turn_off(hass: HomeAssistant) -> None:
     )
 
 
-@pytest.mark.asyncio
-async def test_turn_on_api_error(hass: HomeAssistant) -> None:
-    """Test turn_on raises HomeAssistantError on API failure."""
+@pytest.mark.parametrize(
+    ("turn", "enabled"),
+    [("async_turn_on", True), ("async_turn_off", False)],
+    ids=["on", "off"],
+)
+async def test_turn_on_off_updates_state_before_refresh(
+    turn: str, enabled: bool
+) -> None:
+    """Test the new PoE state is written before the coordinator refresh."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1",
+        {"AA-BB-CC-DD-EE-02_1": {**SAMPLE_PORT_ENABLED, "poe_enabled": not enabled}},
     )
-    api = switch.coordinator.api_client
-    api.set_port_profile_override.side_effect = OmadaApiError("Profile override failed")
-
-    with (
-        patch.object(switch.coordinator, "async_request_refresh", new=AsyncMock()),
-        pytest.raises(HomeAssistantError),
-    ):
-        await switch.async_turn_on()
-
-    # PoE mode should NOT have been called since profile override failed.
-    api.set_port_poe_mode.assert_not_awaited()
-
-
-@pytest.mark.asyncio
-async def test_turn_off_poe_mode_error(hass: HomeAssistant) -> None:
-    """Test turn_off raises HomeAssistantError on PoE mode API error."""
-    switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+    refresh = switch.coordinator.async_request_refresh
+    state_at_refresh: list[bool | None] = []
+    refresh.side_effect = lambda: state_at_refresh.append(switch.is_on)
+
+    with patch.object(switch, "async_write_ha_state") as mock_write:
+        await getattr(switch, turn)()
+
+    mock_write.assert_called_once()
+    assert state_at_refresh == [enabled]
+    # The optimistic state lives on the entity, not in the shared port data.
+    assert (
+        switch.coordinator.data["poe_ports"]["AA-BB-CC-DD-EE-02_1"]["poe_enabled"]
+        is not enabled
     )
-    api = switch.coordinator.api_client
-    api.set_port_poe_mode.side_effect = OmadaApiError("PoE mode failed")
-
-    with (
-        patch.object(switch.coordinator, "async_request_refresh", new=AsyncMock()),
-        pytest.raises(HomeAssistantError),
-    ):
-        await switch.async_turn_off()
-
-    # Profile override was called, but PoE mode failed.
-    api.set_port_profile_override.assert_awaited_once()
-    api.set_port_poe_mode.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_turn_on_poe_permissions_error(hass: HomeAssistant) -> None:
-    """Test PoE permissions error (-1007) raises HomeAssistantError."""
+async def test_coordinator_update_clears_optimistic_state() -> None:
+    """Test the next coordinator update replaces the optimistic PoE state."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
-    )
-    api = switch.coordinator.api_client
-    api.set_port_profile_override.side_effect = OmadaApiError(
-        "No permission", error_code=-1007
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
 
-    with (
-        patch.object(switch.coordinator, "async_request_refresh", new=AsyncMock()),
-        pytest.raises(HomeAssistantError, match="Insufficient permissions"),
-    ):
-        await switch.async_turn_on()
+    await switch.async_turn_off()
+    assert switch.is_on is False
 
-    # PoE mode should NOT be called since profile override failed with permissions.
-    api.set_port_poe_mode.assert_not_awaited()
+    # The controller still reports PoE on, e.g. because the refresh failed.
+    switch._handle_coordinator_update()  # noqa: SLF001
+    assert switch.is_on is True
 
 
-@pytest.mark.asyncio
-async def test_turn_off_poe_permissions_error_1005(hass: HomeAssistant) -> None:
-    """Test PoE permissions error (-1005) raises HomeAssistantError."""
+@pytest.mark.parametrize(
+    ("turn", "failing_call", "error", "match", "poe_mode_awaited"),
+    [
+        (
+            "async_turn_on",
+            "set_port_profile_override",
+            _ERR_PROFILE,
+            "Failed to set PoE on",
+            False,
+        ),
+        (
+            "async_turn_off",
+            "set_port_poe_mode",
+            _ERR_POE_MODE,
+            "Failed to set PoE off",
+            True,
+        ),
+        (
+            "async_turn_on",
+            "set_port_profile_override",
+            _ERR_PERM_1007,
+            "Insufficient permissions",
+            False,
+        ),
+        (
+            "async_turn_off",
+            "set_port_poe_mode",
+            _ERR_PERM_1005,
+            "Insufficient permissions",
+            True,
+        ),
+    ],
+    ids=[
+        "on_profile_error",
+        "off_poe_mode_error",
+        "on_permissions_1007",
+        "off_permissions_1005",
+    ],
+)
+async def test_turn_on_off_api_error(
+    turn: str,
+    failing_call: str,
+    error: OmadaApiError,
+    match: str,
+    poe_mode_awaited: bool,
+) -> None:
+    """Test API errors raise HomeAssistantError and stop the write sequence."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
     api = switch.coordinator.api_client
-    api.set_port_poe_mode.side_effect = OmadaApiError("Access denied", error_code=-1005)
+    getattr(api, failing_call).side_effect = error
 
-    with (
-        patch.object(switch.coordinator, "async_request_refresh", new=AsyncMock()),
-        pytest.raises(HomeAssistantError, match="Insufficient permissions"),
-    ):
-        await switch.async_turn_off()
+    with pytest.raises(HomeAssistantError, match=match):
+        await getattr(switch, turn)()
 
-    # Profile override was called; PoE mode failed with permissions.
+    # Profile override always runs first; PoE mode only runs if it succeeded.
     api.set_port_profile_override.assert_awaited_once()
-    api.set_port_poe_mode.assert_awaited_once()
+    assert api.set_port_poe_mode.await_count == int(poe_mode_awaited)
+    switch.coordinator.async_request_refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_turn_on_refreshes_coordinator(hass: HomeAssistant) -> None:
+async def test_turn_on_refreshes_coordinator() -> None:
     """Test that successful turn_on triggers coordinator refresh."""
     switch = _create_switch(
-        hass, "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
+        "AA-BB-CC-DD-EE-02_1", {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
 
-    with patch.object(
-        switch.coordinator, "async_request_refresh", new=AsyncMock()
-    ) as mock_refresh:
-        await switch.async_turn_on()
+    await switch.async_turn_on()
 
-    mock_refresh.assert_awaited_once()
+    switch.coordinator.async_request_refresh.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_state_reflects_coordinator_update(hass: HomeAssistant) -> None:
+def test_state_reflects_coordinator_update() -> None:
     """Test that state changes when coordinator data changes."""
     poe_ports = {"AA-BB-CC-DD-EE-02_1": {**SAMPLE_PORT_ENABLED}}
-    switch = _create_switch(hass, "AA-BB-CC-DD-EE-02_1", poe_ports)
+    switch = _create_switch("AA-BB-CC-DD-EE-02_1", poe_ports)
 
     assert switch.is_on is True
 
@@ -367,154 +396,129 @@ async def test_state_reflects_coordinator_update(hass: HomeAssistant) -> None:
 WIRELESS_MAC = "11-22-33-44-55-AA"
 WIRED_MAC = "11-22-33-44-55-BB"
 
+# process_client is pure, so the processed clients are built once at import.
+_WIRELESS_DATA = process_client(SAMPLE_CLIENT_WIRELESS)
+_WIRELESS_BLOCKED_DATA = process_client({**SAMPLE_CLIENT_WIRELESS, "blocked": True})
+
 
 def _build_client_coordinator(
-    hass: HomeAssistant,
     clients: dict[str, dict[str, Any]] | None = None,
-) -> OmadaClientCoordinator:
-    """Create a client coordinator with mock data."""
-    coordinator = OmadaClientCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
-        selected_client_macs=[WIRELESS_MAC, WIRED_MAC],
+) -> SimpleNamespace:
+    """Create a stub client coordinator with mock data."""
+    return create_stub_coordinator(
+        clients or {},
+        MagicMock(spec=OmadaApiClient),
+        async_request_refresh=AsyncMock(),
     )
-    coordinator.data = clients or {}
-    coordinator.api_client.block_client = AsyncMock()
-    coordinator.api_client.unblock_client = AsyncMock()
-    return coordinator
 
 
 def _create_block_switch(
-    hass: HomeAssistant,
     client_mac: str,
     clients: dict[str, dict[str, Any]],
 ) -> OmadaClientBlockSwitch:
     """Create an OmadaClientBlockSwitch entity."""
-    coordinator = _build_client_coordinator(hass, clients)
+    coordinator = _build_client_coordinator(clients)
     return OmadaClientBlockSwitch(coordinator=coordinator, client_mac=client_mac)
 
 
-async def test_block_switch_unique_id(hass: HomeAssistant) -> None:
+def test_block_switch_unique_id() -> None:
     """Test block switch unique ID format."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    switch = _create_block_switch(hass, WIRELESS_MAC, {WIRELESS_MAC: data})
+    switch = _create_block_switch(WIRELESS_MAC, {WIRELESS_MAC: _WIRELESS_DATA})
     assert switch.unique_id == f"omada_open_api_{WIRELESS_MAC}_block"
 
 
-async def test_block_switch_name(hass: HomeAssistant) -> None:
+def test_block_switch_name() -> None:
     """Test block switch name includes client name."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    switch = _create_block_switch(hass, WIRELESS_MAC, {WIRELESS_MAC: data})
+    switch = _create_block_switch(WIRELESS_MAC, {WIRELESS_MAC: _WIRELESS_DATA})
     assert switch.translation_key == "network_access"
 
 
-async def test_block_switch_is_on_not_blocked(hass: HomeAssistant) -> None:
-    """Test switch is ON when client is NOT blocked."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    switch = _create_block_switch(hass, WIRELESS_MAC, {WIRELESS_MAC: data})
-    assert switch.is_on is True
-
-
-async def test_block_switch_is_on_blocked(hass: HomeAssistant) -> None:
-    """Test switch is OFF when client IS blocked."""
-    raw = dict(SAMPLE_CLIENT_WIRELESS)
-    raw["blocked"] = True
-    data = process_client(raw)
-    switch = _create_block_switch(hass, WIRELESS_MAC, {WIRELESS_MAC: data})
-    assert switch.is_on is False
-
-
-async def test_block_switch_is_on_missing(hass: HomeAssistant) -> None:
-    """Test switch returns None when client missing."""
-    switch = _create_block_switch(hass, WIRELESS_MAC, {})
-    assert switch.is_on is None
-
-
-async def test_block_switch_available(hass: HomeAssistant) -> None:
-    """Test switch available when client exists."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    switch = _create_block_switch(hass, WIRELESS_MAC, {WIRELESS_MAC: data})
-    assert switch.available is True
-
-
-async def test_block_switch_unavailable_missing(hass: HomeAssistant) -> None:
-    """Test switch unavailable when client missing."""
-    switch = _create_block_switch(hass, WIRELESS_MAC, {})
-    assert switch.available is False
-
-
-async def test_block_switch_unavailable_coordinator_failure(
-    hass: HomeAssistant,
+@pytest.mark.parametrize(
+    ("client_data", "expected"),
+    [
+        (_WIRELESS_DATA, True),
+        (_WIRELESS_BLOCKED_DATA, False),
+        (None, None),
+    ],
+    ids=["not_blocked", "blocked", "missing"],
+)
+def test_block_switch_is_on(
+    client_data: dict[str, Any] | None, expected: bool | None
 ) -> None:
-    """Test switch unavailable on coordinator failure."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    switch = _create_block_switch(hass, WIRELESS_MAC, {WIRELESS_MAC: data})
-    switch.coordinator.last_update_success = False
-    assert switch.available is False
+    """Test switch is ON unless the client is blocked, and None when missing."""
+    clients = {} if client_data is None else {WIRELESS_MAC: client_data}
+    switch = _create_block_switch(WIRELESS_MAC, clients)
+    assert switch.is_on is expected
+
+
+@pytest.mark.parametrize(
+    ("client_data", "last_update_success", "expected"),
+    [
+        (_WIRELESS_DATA, True, True),
+        (None, True, False),
+        (_WIRELESS_DATA, False, False),
+    ],
+    ids=["available", "missing", "coordinator_failure"],
+)
+def test_block_switch_available(
+    client_data: dict[str, Any] | None,
+    last_update_success: bool,
+    expected: bool,
+) -> None:
+    """Test availability needs a successful update and the client's data."""
+    clients = {} if client_data is None else {WIRELESS_MAC: client_data}
+    switch = _create_block_switch(WIRELESS_MAC, clients)
+    switch.coordinator.last_update_success = last_update_success
+    assert switch.available is expected
 
 
-async def test_block_switch_turn_off_blocks(hass: HomeAssistant) -> None:
+async def test_block_switch_turn_off_blocks() -> None:
     """Test turning switch OFF blocks the client."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    coordinator = _build_client_coordinator(hass, {WIRELESS_MAC: data})
+    coordinator = _build_client_coordinator({WIRELESS_MAC: _WIRELESS_DATA})
     switch = OmadaClientBlockSwitch(coordinator=coordinator, client_mac=WIRELESS_MAC)
 
-    with patch.object(
-        switch.coordinator, "async_request_refresh", new=AsyncMock()
-    ) as mock_refresh:
-        await switch.async_turn_off()
+    await switch.async_turn_off()
 
     coordinator.api_client.block_client.assert_called_once_with(
         TEST_SITE_ID, WIRELESS_MAC
     )
-    mock_refresh.assert_awaited_once()
+    switch.coordinator.async_request_refresh.assert_awaited_once()
 
 
-async def test_block_switch_turn_on_unblocks(hass: HomeAssistant) -> None:
+async def test_block_switch_turn_on_unblocks() -> None:
     """Test turning switch ON unblocks the client."""
-    raw = dict(SAMPLE_CLIENT_WIRELESS)
-    raw["blocked"] = True
-    data = process_client(raw)
-    coordinator = _build_client_coordinator(hass, {WIRELESS_MAC: data})
+    coordinator = _build_client_coordinator({WIRELESS_MAC: _WIRELESS_BLOCKED_DATA})
     switch = OmadaClientBlockSwitch(coordinator=coordinator, client_mac=WIRELESS_MAC)
 
-    with patch.object(
-        switch.coordinator, "async_request_refresh", new=AsyncMock()
-    ) as mock_refresh:
-        await switch.async_turn_on()
+    await switch.async_turn_on()
 
     coordinator.api_client.unblock_client.assert_called_once_with(
         TEST_SITE_ID, WIRELESS_MAC
     )
-    mock_refresh.assert_awaited_once()
+    switch.coordinator.async_request_refresh.assert_awaited_once()
 
 
-async def test_block_switch_turn_off_api_error(hass: HomeAssistant) -> None:
+async def test_block_switch_turn_off_api_error() -> None:
     """Test block switch raises HomeAssistantError on API error."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    coordinator = _build_client_coordinator(hass, {WIRELESS_MAC: data})
+    coordinator = _build_client_coordinator({WIRELESS_MAC: _WIRELESS_DATA})
     switch = OmadaClientBlockSwitch(coordinator=coordinator, client_mac=WIRELESS_MAC)
-    coordinator.api_client.block_client.side_effect = OmadaApiError("fail")
+    coordinator.api_client.block_client.side_effect = _ERR_FAIL
     with pytest.raises(HomeAssistantError):
         await switch.async_turn_off()
 
 
-async def test_block_switch_turn_on_api_error(hass: HomeAssistant) -> None:
+async def test_block_switch_turn_on_api_error() -> None:
     """Test unblock switch raises HomeAssistantError on API error."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    coordinator = _build_client_coordinator(hass, {WIRELESS_MAC: data})
+    coordinator = _build_client_coordinator({WIRELESS_MAC: _WIRELESS_DATA})
     switch = OmadaClientBlockSwitch(coordinator=coordinator, client_mac=WIRELESS_MAC)
-    coordinator.api_client.unblock_client.side_effect = OmadaApiError("fail")
+    coordinator.api_client.unblock_client.side_effect = _ERR_FAIL
     with pytest.raises(HomeAssistantError):
         await switch.async_turn_on()
 
 
-async def test_block_switch_device_info(hass: HomeAssistant) -> None:
+def test_block_switch_device_info() -> None:
     """Test block switch device info."""
-    data = process_client(SAMPLE_CLIENT_WIRELESS)
-    switch = _create_block_switch(hass, WIRELESS_MAC, {WIRELESS_MAC: data})
+    switch = _create_block_switch(WIRELESS_MAC, {WIRELESS_MAC: _WIRELESS_DATA})
     info = switch.device_info
     assert info is not None
     assert info["identifiers"] == {("omada_open_api", WIRELESS_MAC)}
@@ -525,111 +529,100 @@ async def test_block_switch_device_info(hass: HomeAssistant) -> None:
 # ===========================================================================
 
 
-def _create_led_switch(hass: HomeAssistant) -> OmadaLedSwitch:
-    """Create an OmadaLedSwitch entity."""
-    coordinator = OmadaSiteCoordinator(
-        hass=hass,
-        api_client=MagicMock(),
-        site_id=TEST_SITE_ID,
-        site_name=TEST_SITE_NAME,
+def _create_led_switch() -> OmadaLedSwitch:
+    """Create an OmadaLedSwitch entity backed by a stub site coordinator."""
+    api_client = MagicMock(spec=OmadaApiClient)
+    api_client.get_led_setting.return_value = {"enable": True}
+    return OmadaLedSwitch(
+        create_stub_coordinator(
+            _build_coordinator_data(),
+            api_client,
+            async_request_refresh=AsyncMock(),
+        )
     )
-    coordinator.data = {
-        "devices": {},
-        "poe_budget": {},
-        "poe_ports": {},
-        "site_id": TEST_SITE_ID,
-        "site_name": TEST_SITE_NAME,
-    }
-    coordinator.api_client.get_led_setting = AsyncMock(return_value={"enable": True})
-    coordinator.api_client.set_led_setting = AsyncMock(return_value={})
-    return OmadaLedSwitch(coordinator)
-
 
-async def test_led_switch_unique_id(hass: HomeAssistant) -> None:
-    """Test LED switch unique ID format."""
-    switch = _create_led_switch(hass)
-    assert switch.unique_id == f"omada_open_api_{TEST_SITE_ID}_led"
 
+@pytest.fixture(scope="module")
+def led_switch() -> OmadaLedSwitch:
+    """Return one LED switch shared by the read-only property tests."""
+    return _create_led_switch()
 
-async def test_led_switch_name(hass: HomeAssistant) -> None:
-    """Test LED switch name includes site name."""
-    switch = _create_led_switch(hass)
-    assert switch.translation_key == "led"
-    assert switch.translation_placeholders == {"site_name": TEST_SITE_NAME}
 
-
-async def test_led_switch_is_on_initial(hass: HomeAssistant) -> None:
-    """Test LED switch is_on is None before first update."""
-    switch = _create_led_switch(hass)
-    assert switch.is_on is None
+@pytest.mark.parametrize(
+    ("attr", "expected"),
+    [
+        ("unique_id", f"omada_open_api_{TEST_SITE_ID}_led"),
+        ("translation_key", "led"),
+        ("translation_placeholders", {"site_name": TEST_SITE_NAME}),
+        # is_on stays None until the first update fetches the LED setting.
+        ("is_on", None),
+        ("available", True),
+    ],
+    ids=["unique_id", "translation_key", "placeholders", "is_on_initial", "available"],
+)
+def test_led_switch_properties(
+    led_switch: OmadaLedSwitch, attr: str, expected: Any
+) -> None:
+    """Test LED switch identity and initial state."""
+    assert getattr(led_switch, attr) == expected
 
 
-async def test_led_switch_is_on_after_update(hass: HomeAssistant) -> None:
+async def test_led_switch_is_on_after_update() -> None:
     """Test LED switch is_on reflects API after update."""
-    switch = _create_led_switch(hass)
+    switch = _create_led_switch()
     await switch.async_update()
     assert switch.is_on is True
 
 
-async def test_led_switch_available(hass: HomeAssistant) -> None:
-    """Test LED switch available when coordinator is healthy."""
-    switch = _create_led_switch(hass)
-    assert switch.available is True
-
-
-async def test_led_switch_unavailable(hass: HomeAssistant) -> None:
+def test_led_switch_unavailable() -> None:
     """Test LED switch unavailable on coordinator failure."""
-    switch = _create_led_switch(hass)
+    switch = _create_led_switch()
     switch.coordinator.last_update_success = False
     assert switch.available is False
 
 
-async def test_led_switch_turn_on(hass: HomeAssistant) -> None:
+async def test_led_switch_turn_on() -> None:
     """Test turning LED switch ON calls set_led_setting(enable=True)."""
-    switch = _create_led_switch(hass)
-    switch.hass = hass
-    with patch.object(switch, "async_write_ha_state"):
-        await switch.async_turn_on()
+    switch = _create_led_switch()
+    await switch.async_turn_on()
     switch.coordinator.api_client.set_led_setting.assert_called_once_with(
         TEST_SITE_ID, enable=True
     )
     assert switch.is_on is True
 
 
-async def test_led_switch_turn_off(hass: HomeAssistant) -> None:
+async def test_led_switch_turn_off() -> None:
     """Test turning LED switch OFF calls set_led_setting(enable=False)."""
-    switch = _create_led_switch(hass)
-    switch.hass = hass
-    with patch.object(switch, "async_write_ha_state"):
-        await switch.async_turn_off()
+    switch = _create_led_switch()
+    await switch.async_turn_off()
     switch.coordinator.api_client.set_led_setting.assert_called_once_with(
         TEST_SITE_ID, enable=False
     )
     assert switch.is_on is False
 
 
-async def test_led_switch_turn_on_api_error(hass: HomeAssistant) -> None:
+async def test_led_switch_turn_on_api_error() -> None:
     """Test LED switch raises HomeAssistantError on turn on error."""
-    switch = _create_led_switch(hass)
-    switch.coordinator.api_client.set_led_setting.side_effect = OmadaApiError("fail")
+    switch = _create_led_switch()
+    switch.coordinator.api_client.set_led_setting.side_effect = _ERR_FAIL
     with pytest.raises(HomeAssistantError):
         await switch.async_turn_on()
     assert switch.is_on is None  # Stays None since never successfully fetched.
 
 
-async def test_led_switch_turn_off_api_error(hass: HomeAssistant) -> None:
+async def test_led_switch_turn_off_api_error() -> None:
     """Test LED switch raises HomeAssistantError on turn off error."""
-    switch = _create_led_switch(hass)
-    switch.coordinator.api_client.set_led_setting.side_effect = OmadaApiError("fail")
+    switch = _create_led_switch()
+    switch.coordinator.api_client.set_led_setting.side_effect = _ERR_FAIL
     with pytest.raises(HomeAssistantError):
         await switch.async_turn_off()
     assert switch.is_on is None
 
 
-async def test_led_switch_update_api_error(hass: HomeAssistant) -> None:
+async def test_led_switch_update_api_error() -> None:
     """Test LED switch handles update error gracefully."""
-    switch = _create_led_switch(hass)
-    switch.coordinator.api_client.get_led_setting.side_effect = OmadaApiError("fail")
+    switch = _create_led_switch()
+    switch.coordinator.api_client.get_led_setting.side_effect = _ERR_FAIL
     await switch.async_update()
     assert switch.is_on is None
 
@@ -653,11 +646,13 @@ async def test_setup_entry_viewer_only_skips_poe_and_led(
         {"AA-BB-CC-DD-EE-02_1": SAMPLE_PORT_ENABLED}
     )
 
-    entry = MagicMock()
-    entry.runtime_data = MagicMock()
-    entry.runtime_data.coordinators = {TEST_SITE_ID: coordinator}
-    entry.runtime_data.client_coordinators = []
-    entry.runtime_data.has_write_access = False
+    entry = SimpleNamespace(
+        runtime_data=SimpleNamespace(
+            coordinators={TEST_SITE_ID: coordinator},
+            client_coordinators=[],
+            has_write_access=False,
+        )
+    )
 
     added_entities: list = []
 